@@ -7,12 +7,14 @@ factory functions. These are used with FastAPI's Depends() system.
 
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Literal, Optional, Tuple
 
 from fastapi import Depends
 
 from app.core.config import Settings, get_settings
 from app.services.bdd_generator import BDDGenerator
+from app.services.llm_client import BaseLLMClient, get_llm_client
 from app.services.test_generator import TestGenerator
 
 
@@ -47,6 +49,52 @@ def resolve_ai_provider(
         return None, provider, False
 
 
+# Generators are built once per provider configuration so their LLM client,
+# and the SDK's pooled HTTP connections behind it, outlive a single request.
+# Both generators share the one client built for a configuration. Reloading
+# settings with a different key or provider yields a new entry.
+@lru_cache(maxsize=8)
+def _build_llm_client(
+    api_key: Optional[str],
+    provider: Literal["openai", "anthropic"],
+    use_ai: bool,
+) -> Optional[BaseLLMClient]:
+    """Build (or reuse) the LLM client shared by the generators, if AI is enabled."""
+    if not use_ai:
+        return None
+    return get_llm_client(provider=provider, api_key=api_key)
+
+
+@lru_cache(maxsize=8)
+def _build_test_generator(
+    api_key: Optional[str],
+    provider: Literal["openai", "anthropic"],
+    use_ai: bool,
+) -> TestGenerator:
+    """Build (or reuse) the TestGenerator for a provider configuration."""
+    return TestGenerator(
+        api_key=api_key,
+        provider=provider,
+        use_ai=use_ai,
+        client=_build_llm_client(api_key, provider, use_ai),
+    )
+
+
+@lru_cache(maxsize=8)
+def _build_bdd_generator(
+    api_key: Optional[str],
+    provider: Literal["openai", "anthropic"],
+    use_ai: bool,
+) -> BDDGenerator:
+    """Build (or reuse) the BDDGenerator for a provider configuration."""
+    return BDDGenerator(
+        api_key=api_key,
+        provider=provider,
+        use_ai=use_ai,
+        client=_build_llm_client(api_key, provider, use_ai),
+    )
+
+
 def get_test_generator(
     settings: Settings = Depends(get_settings),
 ) -> TestGenerator:
@@ -60,14 +108,10 @@ def get_test_generator(
         settings: Application settings (injected by FastAPI).
 
     Returns:
-        Configured TestGenerator instance.
+        Configured TestGenerator instance, shared by every request with
+        the same provider configuration.
     """
-    api_key, provider, use_ai = resolve_ai_provider(settings)
-    return TestGenerator(
-        api_key=api_key,
-        provider=provider,
-        use_ai=use_ai,
-    )
+    return _build_test_generator(*resolve_ai_provider(settings))
 
 
 def get_bdd_generator(
@@ -83,11 +127,21 @@ def get_bdd_generator(
         settings: Application settings (injected by FastAPI).
 
     Returns:
-        Configured BDDGenerator instance.
+        Configured BDDGenerator instance, shared by every request with
+        the same provider configuration.
     """
-    api_key, provider, use_ai = resolve_ai_provider(settings)
-    return BDDGenerator(
-        api_key=api_key,
-        provider=provider,
-        use_ai=use_ai,
-    )
+    return _build_bdd_generator(*resolve_ai_provider(settings))
+
+
+def warm_generators(settings: Settings) -> None:
+    """Build the shared generators for the configured provider ahead of time.
+
+    Called once at application startup so the first request reuses
+    generators that already exist instead of constructing them. No
+    provider calls are made.
+
+    Args:
+        settings: Application settings.
+    """
+    get_test_generator(settings)
+    get_bdd_generator(settings)
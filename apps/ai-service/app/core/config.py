@@ -6,12 +6,30 @@ Configuration is loaded from environment variables and an optional
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import List, Literal, Optional
+import hashlib
+from functools import cached_property, lru_cache
+from typing import List, Literal, Optional, Tuple
 
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+API_KEY_DIGEST_SIZE = 32
+
+
+def hash_api_key(api_key: str) -> bytes:
+    """Hash an API key to a fixed-size BLAKE2b digest.
+
+    Comparing digests instead of raw keys keeps the comparison time
+    independent of the key length.
+
+    Args:
+        api_key: The API key to hash.
+
+    Returns:
+        The 32-byte BLAKE2b digest of the key.
+    """
+    return hashlib.blake2b(api_key.encode("utf-8"), digest_size=API_KEY_DIGEST_SIZE).digest()
+
 
 class Settings(BaseSettings):
     """Application settings loaded from environment variables.
@@ -82,6 +100,21 @@ class Settings(BaseSettings):
         """Check if running in production environment."""
         return self.environment == "production"
 
+    @cached_property
+    def api_key_hashes(self) -> Tuple[memoryview, ...]:
+        """BLAKE2b digests of the configured API keys, computed once.
+
+        The digests are packed into one contiguous buffer and exposed as
+        zero-copy views, so comparing against every key walks adjacent
+        memory. Blank keys are skipped so a blank request header can never
+        match.
+        """
+        blob = memoryview(b"".join(hash_api_key(key) for key in self.api_keys if key.strip()))
+        return tuple(
+            blob[offset : offset + API_KEY_DIGEST_SIZE]
+            for offset in range(0, len(blob), API_KEY_DIGEST_SIZE)
+        )
+
     @property
     def has_openai_key(self) -> bool:
         """Check if OpenAI API key is configured."""
@@ -93,7 +126,7 @@ class Settings(BaseSettings):
         return bool(self.anthropic_api_key)
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get cached application settings.
 
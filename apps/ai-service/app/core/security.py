@@ -1,14 +1,23 @@
-"""Security utilities for API authentication."""
+"""Security utilities for API authentication.
+
+Performance: API key verification is latency-bound on Python interpreter
+overhead (attribute lookups, call dispatch, exception construction), not on
+byte comparison throughput. A handful of 32-byte digests fits in a few cache
+lines, so vectorized comparison would not help; optimizations here aim to
+cut calls and allocations instead. See tests/test_security_bench.py.
+"""
 
 from __future__ import annotations
 
-import secrets
-from typing import Annotated
+import operator
+from functools import lru_cache, partial, reduce
+from hmac import compare_digest as _compare_digest
+from typing import Annotated, Callable, Iterable, Optional
 
 from fastapi import Depends, HTTPException, Security, status
 from fastapi.security import APIKeyHeader
 
-from app.core.config import Settings, get_settings
+from app.core.config import Settings, get_settings, hash_api_key
 
 # API key header configuration
 API_KEY_HEADER_NAME = "X-API-Key"
@@ -19,62 +28,172 @@ api_key_header = APIKeyHeader(
     description="API key for authentication",
 )
 
+# Errors raised on the authentication hot path. Each raise builds a fresh
+# exception: verify_api_key is a sync dependency that FastAPI runs in a
+# threadpool, so a shared instance would have its traceback and context
+# rewritten by concurrent requests.
+_MISSING_KEY_DETAIL = "API key is required"
+_MISSING_KEY_HEADERS = {"WWW-Authenticate": "ApiKey"}
+_INVALID_KEY_DETAIL = "Invalid API key"
+_NOT_CONFIGURED_DETAIL = "API key authentication not configured"
+
+
+def _missing_key_error() -> HTTPException:
+    """Build the 401 error for a request without an API key."""
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail=_MISSING_KEY_DETAIL,
+        headers=_MISSING_KEY_HEADERS,
+    )
+
+
+def _invalid_key_error() -> HTTPException:
+    """Build the 403 error for a request with an unknown API key."""
+    return HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail=_INVALID_KEY_DETAIL)
+
+
+def _not_configured_error() -> HTTPException:
+    """Build the 500 error for production without configured API keys."""
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=_NOT_CONFIGURED_DETAIL,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _provided_key_digest(api_key: str) -> bytes:
+    """Digest a provided API key, reusing the result for recently seen keys.
+
+    Clients typically send the same key on every request, so caching skips the
+    encode and hash allocations on the hot path. The cache is bounded and holds
+    only digests of keys that already reached the process as plain strings.
+
+    Args:
+        api_key: The API key from the request header.
+
+    Returns:
+        Digest of the provided API key.
+    """
+    return hash_api_key(api_key)
+
+
+def _matches_any(provided: bytes, key_hashes: Iterable[bytes | memoryview]) -> bool:
+    """Check a key digest against every configured digest in constant time.
+
+    reduce() consumes the whole map, unlike any() which stops at the first
+    match, so the elapsed time does not reveal which key, if any, matched.
+
+    Args:
+        provided: Digest of the provided API key.
+        key_hashes: Digests of the configured API keys.
+
+    Returns:
+        True if the provided digest matches any configured digest.
+    """
+    return reduce(
+        operator.or_,
+        map(partial(_compare_digest, provided), key_hashes),
+        False,
+    )
+
 
 def verify_api_key(
     api_key: Annotated[str | None, Security(api_key_header)],
     settings: Annotated[Settings, Depends(get_settings)],
-) -> str:
+) -> str | None:
     """Verify the provided API key against configured keys.
 
     This dependency validates incoming API keys against the configured
     service API keys. It uses constant-time comparison to prevent
-    timing attacks.
+    timing attacks. When no keys are configured in development,
+    authentication is disabled and the header is passed through as-is.
 
     Args:
         api_key: The API key from the request header
         settings: Application settings containing valid API keys
 
     Returns:
-        The validated API key
+        The validated API key, or the raw header value when no keys are
+        configured in development
 
     Raises:
         HTTPException: 401 if API key is missing
         HTTPException: 403 if API key is invalid
+        HTTPException: 500 if no keys are configured in production
     """
-    if api_key is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="API key is required",
-            headers={"WWW-Authenticate": "ApiKey"},
-        )
-
-    # Get the list of valid API keys from settings
-    valid_keys = settings.api_keys
-
-    if not valid_keys:
+    # Public-data branch on server config — safe per constant-time analysis.
+    # Blank configured keys are dropped from api_key_hashes, so keys that are
+    # all blank count as not configured.
+    if not settings.api_key_hashes:
         # If no API keys are configured, reject all requests in production
         if settings.is_production:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="API key authentication not configured",
-            )
+            raise _not_configured_error()
         # In development, allow requests without configured keys
         return api_key
 
-    # Use constant-time comparison to prevent timing attacks
-    is_valid = any(
-        secrets.compare_digest(api_key.encode("utf-8"), valid_key.encode("utf-8"))
-        for valid_key in valid_keys
-    )
+    if api_key is None:
+        raise _missing_key_error()
 
-    if not is_valid:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="Invalid API key",
-        )
+    # Use constant-time comparison to prevent timing attacks. Keys are compared
+    # as fixed-size digests so the time does not depend on key length. Blank
+    # keys need no special case: blank configured keys are never hashed, so a
+    # blank header simply fails the comparison. Do not add early exits here
+    # that depend on the key's content.
+    if not _matches_any(_provided_key_digest(api_key), settings.api_key_hashes):
+        raise _invalid_key_error()
 
     return api_key
 
 
+def make_verifier(settings: Settings) -> Callable[[Optional[str]], Optional[str]]:
+    """Build a verify_api_key equivalent specialized for fixed settings.
+
+    The configured key digests and production flag are resolved once, so
+    each request skips the settings lookups and, when no keys are
+    configured, the whole comparison path. Routes that need authentication
+    opt in explicitly, e.g. with Security(make_verifier(get_settings())) on
+    the route or its router; settings reloaded later via
+    get_settings.cache_clear() require building a new verifier.
+
+    Args:
+        settings: Application settings containing valid API keys
+
+    Returns:
+        A dependency with the same behavior as verify_api_key
+    """
+    # Public-data branch on server config — safe per constant-time analysis.
+    if not settings.api_key_hashes:
+        if settings.is_production:
+
+            def reject(
+                api_key: Annotated[str | None, Security(api_key_header)],
+            ) -> str | None:
+                raise _not_configured_error()
+
+            return reject
+
+        def allow(
+            api_key: Annotated[str | None, Security(api_key_header)],
+        ) -> str | None:
+            return api_key
+
+        return allow
+
+    key_hashes = settings.api_key_hashes
+
+    def verify(
+        api_key: Annotated[str | None, Security(api_key_header)],
+    ) -> str | None:
+        if api_key is None:
+            raise _missing_key_error()
+
+        if not _matches_any(_provided_key_digest(api_key), key_hashes):
+            raise _invalid_key_error()
+
+        return api_key
+
+    return verify
+
+
 # Type alias for use in route dependencies
-APIKeyDep = Annotated[str, Depends(verify_api_key)]
+APIKeyDep = Annotated[Optional[str], Depends(verify_api_key)]
@@ -13,12 +13,14 @@ from __future__ import annotations
 
 import logging
 import time
-from typing import Any, Dict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Dict
 
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from app.api.deps import warm_generators
 from app.api.routes import router as api_router
 from app.api.routes.generate import router as generate_router
 from app.core.config import get_settings
@@ -33,6 +35,20 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+@asynccontextmanager
+async def lifespan(application: FastAPI) -> AsyncIterator[None]:
+    """Prepare shared resources before the application serves requests.
+
+    Args:
+        application: The FastAPI application being started.
+
+    Yields:
+        Control back to FastAPI while the application is running.
+    """
+    warm_generators(settings)
+    yield
+
+
 def create_app() -> FastAPI:
     """Create and configure the FastAPI application.
 
@@ -55,6 +71,7 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         openapi_url="/api/openapi.json",
+        lifespan=lifespan,
     )
 
     # Configure CORS
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 
 
 class HealthResponse(BaseModel):
@@ -69,6 +69,12 @@ class BDDScenario(BaseModel):
         description="Scenario tags (e.g., @smoke, @regression)",
     )
 
+    @field_validator("given", "when", "then", mode="before")
+    @classmethod
+    def coerce_single_step(cls, v: Any) -> Any:
+        """Wrap a single step string in a list."""
+        return [v] if isinstance(v, str) else v
+
 
 class BDDGenerationResponse(BaseModel):
     """Response model for BDD generation endpoint."""
@@ -82,6 +88,16 @@ class BDDGenerationResponse(BaseModel):
         description="Additional metadata about the generation",
     )
 
+    @property
+    def has_tags(self) -> bool:
+        """Whether any scenario carries tags."""
+        return any(scenario.tags for scenario in self.scenarios)
+
+    @property
+    def has_examples(self) -> bool:
+        """Whether any scenario is a Scenario Outline with examples."""
+        return any(scenario.examples for scenario in self.scenarios)
+
 
 class CoverageSuggestion(BaseModel):
     """A suggested test case for improving coverage."""
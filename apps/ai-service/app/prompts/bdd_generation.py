@@ -130,6 +130,16 @@ Provide your response as a valid JSON object:"""
         "comprehensive": "a comprehensive mix of happy path, error handling, edge cases, and validation scenarios",
     }
 
+    EXAMPLES_INSTRUCTIONS = {
+        True: "- Include Scenario Outlines with Examples tables for data-driven scenarios\n",
+        False: "- Use simple Scenarios without Examples tables\n",
+    }
+
+    TAGS_INSTRUCTIONS = {
+        True: "- Include appropriate tags for each scenario (e.g., @smoke, @regression, @critical)\n",
+        False: "- Do not include tags on scenarios\n",
+    }
+
     GHERKIN_FORMATTING_TEMPLATE = """Format the following BDD scenarios as a complete Gherkin feature file:
 
 Feature Name: {feature_name}
@@ -194,27 +204,13 @@ def build_bdd_generation_user_prompt(
         scenario_focus, BDDGenerationPrompts.SCENARIO_FOCUS_INSTRUCTIONS["comprehensive"]
     )
 
-    examples_instruction = ""
-    if include_examples:
-        examples_instruction = (
-            "- Include Scenario Outlines with Examples tables for data-driven scenarios\n"
-        )
-    else:
-        examples_instruction = "- Use simple Scenarios without Examples tables\n"
-
-    tags_instruction = ""
-    if include_tags:
-        tags_instruction = "- Include appropriate tags for each scenario (e.g., @smoke, @regression, @critical)\n"
-    else:
-        tags_instruction = "- Do not include tags on scenarios\n"
-
     return BDDGenerationPrompts.USER_PROMPT_TEMPLATE.format(
         feature_description=feature_description,
         context_section=context_section,
         max_scenarios=max_scenarios,
         scenario_focus=focus_instruction,
-        examples_instruction=examples_instruction,
-        tags_instruction=tags_instruction,
+        examples_instruction=BDDGenerationPrompts.EXAMPLES_INSTRUCTIONS[bool(include_examples)],
+        tags_instruction=BDDGenerationPrompts.TAGS_INSTRUCTIONS[bool(include_tags)],
     )
 
 
@@ -0,0 +1,48 @@
+"""JSON helpers with an optional orjson fast path.
+
+orjson parses and serializes in C and is used when it is installed;
+otherwise these fall back to the stdlib json module. orjson's decode
+error subclasses json.JSONDecodeError, so callers can keep catching the
+stdlib exception either way.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    orjson = None  # type: ignore[assignment]
+
+
+def loads(content: str | bytes) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        content: JSON text as str or UTF-8 bytes.
+
+    Returns:
+        The decoded Python object.
+
+    Raises:
+        json.JSONDecodeError: If content is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a compact JSON string.
+
+    Args:
+        obj: JSON-serializable object.
+
+    Returns:
+        The JSON document as a str.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, separators=(",", ":"))
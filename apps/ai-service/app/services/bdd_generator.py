@@ -6,15 +6,30 @@ in Gherkin format from feature descriptions using AI models (OpenAI/Anthropic).
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-from typing import Any, Dict, List, Literal, Optional
+import sys
+from typing import (
+    Any,
+    Dict,
+    Iterator,
+    List,
+    Literal,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+from pydantic import TypeAdapter
 
 from app.models.responses import BDDGenerationResponse, BDDScenario
 from app.prompts.bdd_generation import (
     build_bdd_generation_system_prompt,
     build_bdd_generation_user_prompt,
 )
+from app.services import _json
 from app.services.llm_client import (
     BaseLLMClient,
     LLMClientError,
@@ -23,6 +38,64 @@ from app.services.llm_client import (
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of AI responses kept per generator; oldest entries are
+# evicted first.
+RESPONSE_CACHE_SIZE = 256
+
+# Default number of generate_scenarios calls a batch keeps in flight.
+BATCH_CONCURRENCY = 10
+
+# Indented Gherkin step keywords, shared by every formatted step line.
+_GIVEN = "    Given "
+_WHEN = "    When "
+_THEN = "    Then "
+_AND = "    And "
+
+# Mock-mode scenarios, built once at import with tags and examples filled in;
+# _generate_mock_scenarios hands out deep copies with those fields cleared as
+# requested, so callers never share lists with the template.
+_MOCK_SCENARIOS: Tuple[BDDScenario, ...] = (
+    BDDScenario(
+        name="Successfully complete the main flow",
+        given=["the user is logged in", "the user has required permissions"],
+        when=["the user performs the main action"],
+        then=[
+            "the action is completed successfully",
+            "the user sees a success message",
+        ],
+        examples=None,
+        tags=["@smoke", "@happy-path"],
+    ),
+    BDDScenario(
+        name="Validate input data",
+        given=["the user is on the input form"],
+        when=["the user enters <input>", "the user submits the form"],
+        then=["the system shows <result>"],
+        examples=[
+            {"input": "valid_value", "result": "success"},
+            {"input": "invalid_value", "result": "error"},
+            {"input": "empty", "result": "error"},
+        ],
+        tags=["@validation", "@regression"],
+    ),
+    BDDScenario(
+        name="Handle error conditions gracefully",
+        given=["the system is in an error state"],
+        when=["the user attempts to perform an action"],
+        then=[
+            "the user sees an appropriate error message",
+            "the user can recover from the error",
+        ],
+        examples=None,
+        tags=["@error-handling", "@regression"],
+    ),
+)
+
+_CacheKey = Tuple[Optional[str], Optional[str], str, int, bool, bool]
+
+# Built once so every parse reuses the same compiled validator
+_SCENARIO_LIST_ADAPTER: TypeAdapter[List[BDDScenario]] = TypeAdapter(List[BDDScenario])
+
 
 class BDDGenerationError(Exception):
     """Exception raised when BDD generation fails."""
@@ -47,6 +120,8 @@ class BDDGenerator:
         api_key: Optional[str] = None,
         provider: Literal["openai", "anthropic"] = "openai",
         use_ai: bool = True,
+        use_cache: bool = False,
+        client: Optional[BaseLLMClient] = None,
     ) -> None:
         """Initialize the BDD generator.
 
@@ -56,11 +131,23 @@ class BDDGenerator:
             provider: AI provider to use ('openai' or 'anthropic').
             use_ai: If True, uses LLM for generation. If False, returns
                     mock data (useful for testing without API keys).
+            use_cache: Opt-in. If True, identical AI requests made through
+                       this generator are answered from an in-memory cache
+                       instead of calling the LLM again, and concurrent
+                       identical requests share a single LLM call. Such
+                       responses are copies marked with metadata["cached"]
+                       and zero token counts.
+            client: Existing LLM client to use, e.g. one shared with other
+                    generators so they reuse a single connection pool. If
+                    None, a client is created on first use.
         """
         self.api_key = api_key
         self.provider = provider
         self.use_ai = use_ai
-        self._client: Optional[BaseLLMClient] = None
+        self.use_cache = use_cache
+        self._client: Optional[BaseLLMClient] = client
+        self._cache: Dict[_CacheKey, BDDGenerationResponse] = {}
+        self._pending: Dict[_CacheKey, asyncio.Task[BDDGenerationResponse]] = {}
 
     def _get_client(self) -> BaseLLMClient:
         """Get or create the LLM client.
@@ -144,6 +231,124 @@ class BDDGenerator:
                 include_tags=include_tags,
             )
 
+        if not self.use_cache:
+            return await self._request_scenarios(
+                feature_description,
+                context,
+                scenario_focus,
+                max_scenarios,
+                include_examples,
+                include_tags,
+            )
+
+        cache_key: _CacheKey = (
+            feature_description,
+            context,
+            scenario_focus,
+            max_scenarios,
+            include_examples,
+            include_tags,
+        )
+        if cache_key in self._cache:
+            logger.debug("Returning cached BDD scenarios for identical request")
+            return self._cached_copy(self._cache[cache_key])
+
+        task = self._pending.get(cache_key)
+        joined = task is not None
+        if task is None:
+            task = asyncio.ensure_future(
+                self._request_scenarios(
+                    feature_description,
+                    context,
+                    scenario_focus,
+                    max_scenarios,
+                    include_examples,
+                    include_tags,
+                )
+            )
+            self._pending[cache_key] = task
+            task.add_done_callback(lambda done: self._store_result(cache_key, done))
+        else:
+            logger.debug("Joining in-flight BDD generation for identical request")
+
+        # Shielded so one cancelled caller does not cancel the call for the others
+        result = await asyncio.shield(task)
+
+        # Every caller gets its own copy, so none can alter the cached response
+        if joined:
+            return self._cached_copy(result)
+        return result.model_copy(deep=True)
+
+    @staticmethod
+    def _cached_copy(result: BDDGenerationResponse) -> BDDGenerationResponse:
+        """Copy a cached response for a caller that did not call the LLM itself.
+
+        The copy is marked as cached and reports zero token usage, since no
+        tokens were spent on this caller's behalf.
+
+        Args:
+            result: The cached response.
+
+        Returns:
+            A deep copy of the response with cache-hit metadata.
+        """
+        return result.model_copy(
+            deep=True,
+            update={
+                "metadata": {
+                    **result.metadata,
+                    "cached": True,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                }
+            },
+        )
+
+    def _store_result(
+        self, cache_key: _CacheKey, task: asyncio.Task[BDDGenerationResponse]
+    ) -> None:
+        """Move a finished in-flight request into the response cache.
+
+        Args:
+            cache_key: Key of the request the task answered.
+            task: The finished generation task.
+        """
+        del self._pending[cache_key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if len(self._cache) >= RESPONSE_CACHE_SIZE:
+            # Dicts preserve insertion order, so the first key is oldest
+            del self._cache[next(iter(self._cache))]
+        self._cache[cache_key] = task.result()
+
+    async def _request_scenarios(
+        self,
+        feature_description: str,
+        context: Optional[str],
+        scenario_focus: Literal[
+            "happy_path", "error_handling", "validation", "security", "comprehensive"
+        ],
+        max_scenarios: int,
+        include_examples: bool,
+        include_tags: bool,
+    ) -> BDDGenerationResponse:
+        """Call the LLM and build the response for one generation request.
+
+        Args:
+            feature_description: The feature description to generate scenarios from.
+            context: Additional context about the application.
+            scenario_focus: Type of scenarios to focus on.
+            max_scenarios: Maximum number of scenarios to generate.
+            include_examples: Whether to include Scenario Outline examples.
+            include_tags: Whether to include scenario tags.
+
+        Returns:
+            BDDGenerationResponse built from the LLM output.
+
+        Raises:
+            BDDGenerationError: If the LLM call or response parsing fails.
+        """
         try:
             client = self._get_client()
 
@@ -186,7 +391,7 @@ class BDDGenerator:
                 include_tags=include_tags,
             )
 
-            return BDDGenerationResponse(
+            result = BDDGenerationResponse(
                 feature_name=feature_name,
                 feature_description=feature_description,
                 scenarios=scenarios,
@@ -202,6 +407,8 @@ class BDDGenerator:
                 },
             )
 
+            return result
+
         except LLMClientError as e:
             logger.error("LLM client error during BDD generation: %s", e)
             raise BDDGenerationError(f"AI provider error: {e}") from e
@@ -248,6 +455,49 @@ class BDDGenerator:
             include_tags=True,
         )
 
+    async def generate_scenarios_batch(
+        self,
+        requests: Sequence[Mapping[str, Any]],
+        concurrency: int = BATCH_CONCURRENCY,
+    ) -> List[BDDGenerationResponse]:
+        """Generate BDD scenarios for several features concurrently.
+
+        Each request runs through generate_scenarios, at most `concurrency`
+        at a time, so LLM round trips overlap instead of running back to back.
+
+        Args:
+            requests: Keyword arguments for generate_scenarios, one mapping
+                      per feature.
+            concurrency: Maximum number of requests in flight at once.
+
+        Returns:
+            Responses in the same order as requests.
+
+        Raises:
+            ValueError: If concurrency is less than 1.
+            BDDGenerationError: If any request fails; the remaining
+                               requests are cancelled.
+            TypeError: If a request mapping holds arguments that
+                       generate_scenarios does not accept.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(kwargs: Mapping[str, Any]) -> BDDGenerationResponse:
+            async with semaphore:
+                return await self.generate_scenarios(**kwargs)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(run(kwargs)) for kwargs in requests]
+        except* Exception as errors:
+            # Surface the first failure itself rather than the TaskGroup's group
+            raise errors.exceptions[0] from None
+
+        return [task.result() for task in tasks]
+
     def _parse_response(self, content: str) -> Dict[str, Any]:
         """Parse the LLM response content into BDD scenarios.
 
@@ -261,15 +511,18 @@ class BDDGenerator:
             json.JSONDecodeError: If content is not valid JSON.
             ValueError: If the JSON structure is invalid.
         """
-        # Handle potential markdown code blocks
-        content = content.strip()
-        if content.startswith("```"):
-            # Extract content between code blocks
-            lines = content.split("\n")
-            # Remove first line (```json) and last line (```)
-            content = "\n".join(lines[1:-1])
+        # Parse only the span from the first opening bracket to the last
+        # closing one; this drops markdown code fences (and any prose the
+        # model wrapped around the JSON) without a separate stripping pass
+        start = min(
+            (i for i in (content.find("{"), content.find("[")) if i != -1),
+            default=-1,
+        )
+        if start != -1:
+            end = max(content.rfind("}"), content.rfind("]"))
+            content = content[start : end + 1]
 
-        data = json.loads(content)
+        data = _json.loads(content)
 
         # Handle both direct scenarios array and object with scenarios key
         if isinstance(data, list):
@@ -284,10 +537,9 @@ class BDDGenerator:
         else:
             raise ValueError("Expected JSON array or object")
 
-        scenarios: List[BDDScenario] = []
-        for item in scenarios_data:
-            scenario = self._parse_scenario(item)
-            scenarios.append(scenario)
+        scenarios = _SCENARIO_LIST_ADAPTER.validate_python(
+            [self._prepare_scenario(item) for item in scenarios_data]
+        )
 
         return {
             "scenarios": scenarios,
@@ -295,14 +547,17 @@ class BDDGenerator:
             "background": data.get("background") if isinstance(data, dict) else None,
         }
 
-    def _parse_scenario(self, data: Dict[str, Any]) -> BDDScenario:
-        """Parse a single BDD scenario from JSON data.
+    def _prepare_scenario(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Fill in lenient defaults for a single BDD scenario from JSON data.
+
+        Coercion of single-string steps into lists is left to BDDScenario's
+        validator so the whole batch can be validated in one call.
 
         Args:
             data: Dictionary containing scenario data.
 
         Returns:
-            BDDScenario object.
+            Dictionary ready for BDDScenario validation.
 
         Raises:
             ValueError: If required fields are missing.
@@ -310,32 +565,24 @@ class BDDGenerator:
         if "name" not in data:
             raise ValueError("Scenario missing required field: name")
 
-        # Extract given, when, then steps
-        given = data.get("given", [])
-        when = data.get("when", [])
-        then = data.get("then", [])
-
-        # Ensure they are lists
-        if isinstance(given, str):
-            given = [given]
-        if isinstance(when, str):
-            when = [when]
-        if isinstance(then, str):
-            then = [then]
-
-        # Parse examples if present
+        # Drop examples that are not a list of rows
         examples = data.get("examples")
         if examples is not None and not isinstance(examples, list):
             examples = None
 
-        return BDDScenario(
-            name=data["name"],
-            given=given,
-            when=when,
-            then=then,
-            examples=examples,
-            tags=data.get("tags"),
-        )
+        # Intern tags so repeats across scenarios share one string object
+        tags = data.get("tags")
+        if isinstance(tags, list):
+            tags = [sys.intern(tag) if isinstance(tag, str) else tag for tag in tags]
+
+        return {
+            "name": data["name"],
+            "given": data.get("given", []),
+            "when": data.get("when", []),
+            "then": data.get("then", []),
+            "examples": examples,
+            "tags": tags,
+        }
 
     def _extract_feature_name(self, description: str) -> str:
         """Extract a feature name from the description.
@@ -347,7 +594,7 @@ class BDDGenerator:
             A concise feature name.
         """
         # Take first sentence or first 50 characters
-        first_sentence = description.split(".")[0].strip()
+        first_sentence = description.partition(".")[0].strip()
         if len(first_sentence) > 50:
             return first_sentence[:47] + "..."
         return first_sentence
@@ -370,17 +617,44 @@ class BDDGenerator:
         Returns:
             Gherkin-formatted feature file content.
         """
-        lines = [
-            f"Feature: {feature_name}",
-            f"  {feature_description}",
-            "",
-        ]
+        return "".join(
+            self._iter_gherkin(
+                feature_name=feature_name,
+                feature_description=feature_description,
+                scenarios=scenarios,
+                include_tags=include_tags,
+            )
+        )
+
+    def _iter_gherkin(
+        self,
+        feature_name: str,
+        feature_description: str,
+        scenarios: List[BDDScenario],
+        include_tags: bool = True,
+    ) -> Iterator[str]:
+        """Yield a Gherkin feature file in chunks, one per scenario.
+
+        The chunks concatenate to the output of _format_gherkin, so large
+        feature files can be streamed without building the whole string.
+
+        Args:
+            feature_name: Name of the feature.
+            feature_description: Description of the feature.
+            scenarios: List of BDD scenarios.
+            include_tags: Whether to include scenario tags.
+
+        Yields:
+            The feature header, then one blank-line-prefixed block per scenario.
+        """
+        yield f"Feature: {feature_name}\n  {feature_description}\n"
 
         for scenario in scenarios:
+            lines: List[str] = []
+
             # Add tags if present and enabled
-            if include_tags and hasattr(scenario, "tags") and scenario.tags:
-                tags_line = "  " + " ".join(scenario.tags)
-                lines.append(tags_line)
+            if include_tags and scenario.tags:
+                lines.append(f"  {' '.join(scenario.tags)}")
 
             # Use Scenario Outline if there are examples
             if scenario.examples:
@@ -388,36 +662,30 @@ class BDDGenerator:
             else:
                 lines.append(f"  Scenario: {scenario.name}")
 
-            # Given steps
-            for i, step in enumerate(scenario.given):
-                prefix = "Given" if i == 0 else "And"
-                lines.append(f"    {prefix} {step}")
-
-            # When steps
-            for i, step in enumerate(scenario.when):
-                prefix = "When" if i == 0 else "And"
-                lines.append(f"    {prefix} {step}")
-
-            # Then steps
-            for i, step in enumerate(scenario.then):
-                prefix = "Then" if i == 0 else "And"
-                lines.append(f"    {prefix} {step}")
+            # Given/When/Then steps; follow-up steps in each group use "And"
+            for keyword, steps in (
+                (_GIVEN, scenario.given),
+                (_WHEN, scenario.when),
+                (_THEN, scenario.then),
+            ):
+                if steps:
+                    lines.append(keyword + steps[0])
+                    lines.extend([_AND + step for step in steps[1:]])
 
             # Examples table
             if scenario.examples:
                 lines.append("")
                 lines.append("    Examples:")
-                # Header
-                keys = list(scenario.examples[0].keys())
-                lines.append("      | " + " | ".join(keys) + " |")
+                # Header; column order is taken from the first row only
+                keys = tuple(scenario.examples[0])
+                lines.append(f"      | {' | '.join(keys)} |")
                 # Rows
-                for example in scenario.examples:
-                    values = [str(example[k]) for k in keys]
-                    lines.append("      | " + " | ".join(values) + " |")
-
-            lines.append("")
+                lines.extend(
+                    f"      | {' | '.join([str(example[k]) for k in keys])} |"
+                    for example in scenario.examples
+                )
 
-        return "\n".join(lines)
+            yield "\n" + "\n".join(lines) + "\n"
 
     async def _generate_mock_response(
         self,
@@ -489,61 +757,14 @@ class BDDGenerator:
         Returns:
             List of mock BDD scenarios.
         """
-        scenarios: List[BDDScenario] = []
-
-        # Happy path scenario
-        if len(scenarios) < max_scenarios:
-            tags = ["@smoke", "@happy-path"] if include_tags else None
-            scenarios.append(
-                BDDScenario(
-                    name="Successfully complete the main flow",
-                    given=["the user is logged in", "the user has required permissions"],
-                    when=["the user performs the main action"],
-                    then=[
-                        "the action is completed successfully",
-                        "the user sees a success message",
-                    ],
-                    examples=None,
-                    tags=tags,
-                )
-            )
-
-        # Validation scenario with examples
-        if len(scenarios) < max_scenarios:
-            examples: Optional[List[Dict[str, Any]]] = None
-            if include_examples:
-                examples = [
-                    {"input": "valid_value", "result": "success"},
-                    {"input": "invalid_value", "result": "error"},
-                    {"input": "empty", "result": "error"},
-                ]
-            tags = ["@validation", "@regression"] if include_tags else None
-            scenarios.append(
-                BDDScenario(
-                    name="Validate input data",
-                    given=["the user is on the input form"],
-                    when=["the user enters <input>", "the user submits the form"],
-                    then=["the system shows <result>"],
-                    examples=examples,
-                    tags=tags,
-                )
-            )
-
-        # Error handling scenario
-        if len(scenarios) < max_scenarios:
-            tags = ["@error-handling", "@regression"] if include_tags else None
-            scenarios.append(
-                BDDScenario(
-                    name="Handle error conditions gracefully",
-                    given=["the system is in an error state"],
-                    when=["the user attempts to perform an action"],
-                    then=[
-                        "the user sees an appropriate error message",
-                        "the user can recover from the error",
-                    ],
-                    examples=None,
-                    tags=tags,
-                )
-            )
-
-        return scenarios
+        # update values are not copied, so only the cleared fields go through it
+        update: Dict[str, Any] = {}
+        if not include_tags:
+            update["tags"] = None
+        if not include_examples:
+            update["examples"] = None
+        return [
+            scenario.model_copy(deep=True, update=update)
+            # A negative slice bound would count from the end and still return scenarios.
+            for scenario in _MOCK_SCENARIOS[: max(max_scenarios, 0)]
+        ]
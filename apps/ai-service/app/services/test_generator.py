@@ -8,13 +8,14 @@ from __future__ import annotations
 
 import json
 import logging
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Tuple
 
 from app.models.responses import GeneratedTestCase, TestGenerationResponse, TestStep
 from app.prompts.test_generation import (
     build_test_generation_system_prompt,
     build_test_generation_user_prompt,
 )
+from app.services import _json
 from app.services.llm_client import (
     BaseLLMClient,
     LLMClientError,
@@ -23,6 +24,50 @@ from app.services.llm_client import (
 
 logger = logging.getLogger(__name__)
 
+# Steps of the mock test cases. They do not depend on the request, so they are
+# validated once at import; each mock response gets its own copies.
+_MOCK_FUNCTIONAL_STEPS: Tuple[TestStep, ...] = (
+    TestStep(
+        step_number=1,
+        action="Navigate to the feature",
+        expected_result="Feature page is displayed",
+    ),
+    TestStep(
+        step_number=2,
+        action="Perform the main action",
+        expected_result="Action is completed successfully",
+    ),
+    TestStep(
+        step_number=3,
+        action="Verify the result",
+        expected_result="Expected outcome is achieved",
+    ),
+)
+_MOCK_EDGE_CASE_STEPS: Tuple[TestStep, ...] = (
+    TestStep(
+        step_number=1,
+        action="Set up boundary condition",
+        expected_result="System accepts boundary values",
+    ),
+    TestStep(
+        step_number=2,
+        action="Execute feature at boundary",
+        expected_result="Feature handles edge case correctly",
+    ),
+)
+_MOCK_NEGATIVE_STEPS: Tuple[TestStep, ...] = (
+    TestStep(
+        step_number=1,
+        action="Provide invalid input",
+        expected_result="System validates input",
+    ),
+    TestStep(
+        step_number=2,
+        action="Verify error message",
+        expected_result="Appropriate error message is displayed",
+    ),
+)
+
 
 class TestGenerationError(Exception):
     """Exception raised when test generation fails."""
@@ -47,6 +92,7 @@ class TestGenerator:
         api_key: Optional[str] = None,
         provider: Literal["openai", "anthropic"] = "openai",
         use_ai: bool = True,
+        client: Optional[BaseLLMClient] = None,
     ) -> None:
         """Initialize the test generator.
 
@@ -56,11 +102,14 @@ class TestGenerator:
             provider: AI provider to use ('openai' or 'anthropic').
             use_ai: If True, uses LLM for generation. If False, returns
                     mock data (useful for testing without API keys).
+            client: Existing LLM client to use, e.g. one shared with other
+                    generators so they reuse a single connection pool. If
+                    None, a client is created on first use.
         """
         self.api_key = api_key
         self.provider = provider
         self.use_ai = use_ai
-        self._client: Optional[BaseLLMClient] = None
+        self._client: Optional[BaseLLMClient] = client
 
     def _get_client(self) -> BaseLLMClient:
         """Get or create the LLM client.
@@ -251,7 +300,7 @@ class TestGenerator:
             # Remove first line (```json) and last line (```)
             content = "\n".join(lines[1:-1])
 
-        data = json.loads(content)
+        data = _json.loads(content)
 
         # Handle both array and object with test_cases key
         if isinstance(data, dict):
@@ -381,23 +430,7 @@ class TestGenerator:
                 GeneratedTestCase(
                     title=f"Verify basic functionality - {description[:50]}",
                     preconditions="User is logged in and has appropriate permissions",
-                    steps=[
-                        TestStep(
-                            step_number=1,
-                            action="Navigate to the feature",
-                            expected_result="Feature page is displayed",
-                        ),
-                        TestStep(
-                            step_number=2,
-                            action="Perform the main action",
-                            expected_result="Action is completed successfully",
-                        ),
-                        TestStep(
-                            step_number=3,
-                            action="Verify the result",
-                            expected_result="Expected outcome is achieved",
-                        ),
-                    ],
+                    steps=[step.model_copy() for step in _MOCK_FUNCTIONAL_STEPS],
                     expected_result="Feature works as described",
                     priority=default_priority,
                     test_type="functional",
@@ -410,18 +443,7 @@ class TestGenerator:
                 GeneratedTestCase(
                     title=f"Verify edge case handling - {description[:50]}",
                     preconditions="System is in a boundary condition state",
-                    steps=[
-                        TestStep(
-                            step_number=1,
-                            action="Set up boundary condition",
-                            expected_result="System accepts boundary values",
-                        ),
-                        TestStep(
-                            step_number=2,
-                            action="Execute feature at boundary",
-                            expected_result="Feature handles edge case correctly",
-                        ),
-                    ],
+                    steps=[step.model_copy() for step in _MOCK_EDGE_CASE_STEPS],
                     expected_result="Edge cases are handled gracefully",
                     priority=default_priority,
                     test_type="edge_case",
@@ -434,18 +456,7 @@ class TestGenerator:
                 GeneratedTestCase(
                     title=f"Verify error handling - {description[:50]}",
                     preconditions="System is ready to receive invalid input",
-                    steps=[
-                        TestStep(
-                            step_number=1,
-                            action="Provide invalid input",
-                            expected_result="System validates input",
-                        ),
-                        TestStep(
-                            step_number=2,
-                            action="Verify error message",
-                            expected_result="Appropriate error message is displayed",
-                        ),
-                    ],
+                    steps=[step.model_copy() for step in _MOCK_NEGATIVE_STEPS],
                     expected_result="Errors are handled gracefully with clear messages",
                     priority=default_priority,
                     test_type="negative",
@@ -2,17 +2,54 @@
 
 from __future__ import annotations
 
+import asyncio
+from typing import Iterator
+
 import pytest
 from fastapi.testclient import TestClient
 
+from app.api.deps import get_bdd_generator, get_test_generator
 from app.main import app
+from app.services.bdd_generator import BDDGenerator
+from app.services.test_generator import TestGenerator
+
+try:
+    import uvloop
+except ImportError:  # pragma: no cover - uvloop is an optional speedup
+    uvloop = None  # type: ignore[assignment]
+
+# Mock-mode generators answer from in-memory canned data, so route tests never
+# reach a real provider even when an API key is set in the environment.
+_MOCK_TEST_GENERATOR = TestGenerator(use_ai=False)
+_MOCK_BDD_GENERATOR = BDDGenerator(use_ai=False)
+
+
+@pytest.fixture(scope="session")
+def event_loop_policy() -> asyncio.AbstractEventLoopPolicy:
+    """Run async tests on uvloop when it is installed.
+
+    Returns:
+        uvloop's policy if available, otherwise the default asyncio policy.
+    """
+    if uvloop is not None:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
 
 
 @pytest.fixture
-def client() -> TestClient:
+def client() -> Iterator[TestClient]:
     """Create a test client for the FastAPI application.
 
-    Returns:
+    The generator dependencies are overridden with shared mock-mode
+    generators for the duration of the test.
+
+    Yields:
         TestClient instance for making test requests.
     """
-    return TestClient(app)
+    app.dependency_overrides[get_test_generator] = lambda: _MOCK_TEST_GENERATOR
+    app.dependency_overrides[get_bdd_generator] = lambda: _MOCK_BDD_GENERATOR
+    try:
+        yield TestClient(app)
+    finally:
+        app.dependency_overrides.pop(get_test_generator, None)
+        app.dependency_overrides.pop(get_bdd_generator, None)
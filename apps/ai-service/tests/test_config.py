@@ -8,7 +8,7 @@ from unittest.mock import patch
 import pytest
 from pydantic import ValidationError
 
-from app.core.config import Settings, get_settings
+from app.core.config import Settings, get_settings, hash_api_key
 
 
 class TestSettings:
@@ -253,6 +253,33 @@ class TestSettings:
         with pytest.raises(ValidationError):
             Settings(log_level="INVALID")
 
+    def test_api_key_hashes(self) -> None:
+        """api_key_hashes should hold one fixed-size digest per configured key."""
+        settings = Settings(api_keys=["short-key", "k" * 1000])
+
+        assert settings.api_key_hashes == (
+            hash_api_key("short-key"),
+            hash_api_key("k" * 1000),
+        )
+        assert all(len(digest) == 32 for digest in settings.api_key_hashes)
+        assert settings.api_key_hashes is settings.api_key_hashes
+
+    def test_api_key_hashes_share_one_buffer(self) -> None:
+        """api_key_hashes should be views into a single contiguous buffer."""
+        settings = Settings(api_keys=["key-one", "key-two", "key-three"])
+        first, *rest = settings.api_key_hashes
+
+        assert all(view.obj is first.obj for view in rest)
+        assert bytes(first.obj) == b"".join(
+            hash_api_key(key) for key in ["key-one", "key-two", "key-three"]
+        )
+
+    def test_api_key_hashes_skip_blank_keys(self) -> None:
+        """Blank configured keys should never produce a digest."""
+        settings = Settings(api_keys=["valid-key", "", "   "])
+
+        assert settings.api_key_hashes == (hash_api_key("valid-key"),)
+
     def test_invalid_ai_provider_value(self) -> None:
         """Invalid AI provider value should raise validation error."""
         with pytest.raises(ValidationError):
@@ -2,6 +2,15 @@
 
 from fastapi.testclient import TestClient
 
+from app.api.deps import (
+    _build_bdd_generator,
+    _build_test_generator,
+    get_bdd_generator,
+    get_test_generator,
+    warm_generators,
+)
+from app.core.config import get_settings
+
 
 class TestGenerateTestsRoute:
     """Tests for POST /generate/tests endpoint."""
@@ -398,3 +407,39 @@ class TestGenerateBDDRoute:
             },
         )
         assert response.status_code == 422
+
+
+class TestGeneratorDependencies:
+    """Tests for the generator dependency providers."""
+
+    def test_generators_are_reused_across_requests(self) -> None:
+        """Test that the same provider configuration yields one shared generator."""
+        settings = get_settings()
+
+        assert get_test_generator(settings) is get_test_generator(settings)
+        assert get_bdd_generator(settings) is get_bdd_generator(settings)
+
+    def test_generators_share_one_llm_client(self) -> None:
+        """Test that both generators for a configuration use the same LLM client."""
+        test_generator = _build_test_generator("test-key", "openai", True)
+        bdd_generator = _build_bdd_generator("test-key", "openai", True)
+
+        assert test_generator._client is not None
+        assert test_generator._client is bdd_generator._client
+
+    def test_shared_bdd_generator_does_not_cache_responses(self) -> None:
+        """Test that the process-wide BDDGenerator leaves the response cache off."""
+        assert get_bdd_generator(get_settings()).use_cache is False
+
+    def test_warm_generators_prebuilds_shared_generators(self) -> None:
+        """Test that startup warm-up leaves requests only cache hits."""
+        settings = get_settings()
+        warm_generators(settings)
+        test_hits = _build_test_generator.cache_info().hits
+        bdd_hits = _build_bdd_generator.cache_info().hits
+
+        get_test_generator(settings)
+        get_bdd_generator(settings)
+
+        assert _build_test_generator.cache_info().hits == test_hits + 1
+        assert _build_bdd_generator.cache_info().hits == bdd_hits + 1
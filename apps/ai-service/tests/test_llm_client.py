@@ -165,7 +165,7 @@ class TestOpenAIClient:
             with pytest.raises(LLMAuthenticationError, match="API key not configured"):
                 client._get_client()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_success(self, client: OpenAIClient) -> None:
         """Test successful completion."""
         mock_response = MagicMock()
@@ -184,23 +184,24 @@ class TestOpenAIClient:
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            prompt = LLMPrompt(
-                messages=[
-                    LLMMessage(role="system", content="You are helpful."),
-                    LLMMessage(role="user", content="Hello"),
-                ]
-            )
-            result = await client.complete(prompt)
+        client._get_client = lambda: mock_client
+
+        prompt = LLMPrompt(
+            messages=[
+                LLMMessage(role="system", content="You are helpful."),
+                LLMMessage(role="user", content="Hello"),
+            ]
+        )
+        result = await client.complete(prompt)
 
-            assert result.content == "Generated response"
-            assert result.model == "gpt-4-turbo-preview"
-            assert result.prompt_tokens == 10
-            assert result.completion_tokens == 5
-            assert result.total_tokens == 15
-            assert result.finish_reason == "stop"
+        assert result.content == "Generated response"
+        assert result.model == "gpt-4-turbo-preview"
+        assert result.prompt_tokens == 10
+        assert result.completion_tokens == 5
+        assert result.total_tokens == 15
+        assert result.finish_reason == "stop"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_with_json_mode(self, client: OpenAIClient) -> None:
         """Test completion with JSON mode."""
         mock_response = MagicMock()
@@ -219,18 +220,20 @@ class TestOpenAIClient:
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            prompt = LLMPrompt(
-                messages=[LLMMessage(role="user", content="Generate JSON")]
-            )
-            result = await client.complete(prompt, json_mode=True)
+        client._get_client = lambda: mock_client
+
+        prompt = LLMPrompt(
+            messages=[LLMMessage(role="user", content="Generate JSON")]
+        )
+        result = await client.complete(prompt, json_mode=True)
 
-            # Verify json mode was passed
-            call_kwargs = mock_client.chat.completions.create.call_args[1]
-            assert call_kwargs["response_format"] == {"type": "json_object"}
-            assert result.content == '{"key": "value"}'
+        # Verify json mode was passed
+        mock_client.chat.completions.create.assert_awaited_once()
+        call_kwargs = mock_client.chat.completions.create.await_args.kwargs
+        assert call_kwargs["response_format"] == {"type": "json_object"}
+        assert result.content == '{"key": "value"}'
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_simple_success(self, client: OpenAIClient) -> None:
         """Test simple completion method."""
         mock_response = MagicMock()
@@ -249,15 +252,16 @@ class TestOpenAIClient:
         mock_client = AsyncMock()
         mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            result = await client.complete_simple(
-                system_prompt="Be friendly.",
-                user_prompt="Hello",
-            )
+        client._get_client = lambda: mock_client
+
+        result = await client.complete_simple(
+            system_prompt="Be friendly.",
+            user_prompt="Hello",
+        )
 
-            assert result.content == "Hi there!"
+        assert result.content == "Hi there!"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_authentication_error(self, client: OpenAIClient) -> None:
         """Test handling of authentication errors."""
         from openai import AuthenticationError
@@ -271,14 +275,15 @@ class TestOpenAIClient:
             )
         )
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            prompt = LLMPrompt(
-                messages=[LLMMessage(role="user", content="Hello")]
-            )
-            with pytest.raises(LLMAuthenticationError, match="authentication failed"):
-                await client.complete(prompt)
+        client._get_client = lambda: mock_client
+
+        prompt = LLMPrompt(
+            messages=[LLMMessage(role="user", content="Hello")]
+        )
+        with pytest.raises(LLMAuthenticationError, match="authentication failed"):
+            await client.complete(prompt)
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_rate_limit_error(self, client: OpenAIClient) -> None:
         """Test handling of rate limit errors."""
         from openai import RateLimitError
@@ -292,12 +297,13 @@ class TestOpenAIClient:
             )
         )
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            prompt = LLMPrompt(
-                messages=[LLMMessage(role="user", content="Hello")]
-            )
-            with pytest.raises(LLMRateLimitError, match="rate limit"):
-                await client.complete(prompt)
+        client._get_client = lambda: mock_client
+
+        prompt = LLMPrompt(
+            messages=[LLMMessage(role="user", content="Hello")]
+        )
+        with pytest.raises(LLMRateLimitError, match="rate limit"):
+            await client.complete(prompt)
 
 
 class TestAnthropicClient:
@@ -380,7 +386,7 @@ class TestAnthropicClient:
             with pytest.raises(LLMAuthenticationError, match="API key not configured"):
                 client._get_client()
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_success(self, client: AnthropicClient) -> None:
         """Test successful completion."""
         mock_response = MagicMock()
@@ -393,23 +399,24 @@ class TestAnthropicClient:
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_response)
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            prompt = LLMPrompt(
-                messages=[
-                    LLMMessage(role="system", content="You are helpful."),
-                    LLMMessage(role="user", content="Hello"),
-                ]
-            )
-            result = await client.complete(prompt)
+        client._get_client = lambda: mock_client
+
+        prompt = LLMPrompt(
+            messages=[
+                LLMMessage(role="system", content="You are helpful."),
+                LLMMessage(role="user", content="Hello"),
+            ]
+        )
+        result = await client.complete(prompt)
 
-            assert result.content == "Generated response"
-            assert result.model == "claude-3-sonnet-20240229"
-            assert result.prompt_tokens == 10
-            assert result.completion_tokens == 5
-            assert result.total_tokens == 15
-            assert result.finish_reason == "end_turn"
+        assert result.content == "Generated response"
+        assert result.model == "claude-3-sonnet-20240229"
+        assert result.prompt_tokens == 10
+        assert result.completion_tokens == 5
+        assert result.total_tokens == 15
+        assert result.finish_reason == "end_turn"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_with_json_mode(self, client: AnthropicClient) -> None:
         """Test completion with JSON mode adds instruction."""
         mock_response = MagicMock()
@@ -422,21 +429,23 @@ class TestAnthropicClient:
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_response)
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            prompt = LLMPrompt(
-                messages=[
-                    LLMMessage(role="system", content="You are helpful."),
-                    LLMMessage(role="user", content="Generate JSON"),
-                ]
-            )
-            result = await client.complete(prompt, json_mode=True)
+        client._get_client = lambda: mock_client
+
+        prompt = LLMPrompt(
+            messages=[
+                LLMMessage(role="system", content="You are helpful."),
+                LLMMessage(role="user", content="Generate JSON"),
+            ]
+        )
+        result = await client.complete(prompt, json_mode=True)
 
-            # Verify system prompt includes JSON instruction
-            call_kwargs = mock_client.messages.create.call_args[1]
-            assert "JSON" in call_kwargs["system"]
-            assert result.content == '{"result": "ok"}'
+        # Verify system prompt includes JSON instruction
+        mock_client.messages.create.assert_awaited_once()
+        call_kwargs = mock_client.messages.create.await_args.kwargs
+        assert "JSON" in call_kwargs["system"]
+        assert result.content == '{"result": "ok"}'
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_complete_simple_success(self, client: AnthropicClient) -> None:
         """Test simple completion method."""
         mock_response = MagicMock()
@@ -449,13 +458,14 @@ class TestAnthropicClient:
         mock_client = AsyncMock()
         mock_client.messages.create = AsyncMock(return_value=mock_response)
 
-        with patch.object(client, "_get_client", return_value=mock_client):
-            result = await client.complete_simple(
-                system_prompt="Be friendly.",
-                user_prompt="Hello",
-            )
+        client._get_client = lambda: mock_client
+
+        result = await client.complete_simple(
+            system_prompt="Be friendly.",
+            user_prompt="Hello",
+        )
 
-            assert result.content == "Hi there!"
+        assert result.content == "Hi there!"
 
 
 class TestGetLLMClient:
@@ -251,14 +251,17 @@ class TestTestCaseGenerationParams:
                 max_tests=25,  # Max is 20
             )
 
-    def test_valid_test_types(self) -> None:
+    @pytest.mark.parametrize(
+        "test_type",
+        ["functional", "edge_case", "negative", "all"],
+    )
+    def test_valid_test_types(self, test_type: str) -> None:
         """Test all valid test types."""
-        for test_type in ["functional", "edge_case", "negative", "all"]:
-            params = TestCaseGenerationParams(
-                description="Valid description",
-                test_type=test_type,  # type: ignore
-            )
-            assert params.test_type == test_type
+        params = TestCaseGenerationParams(
+            description="Valid description",
+            test_type=test_type,  # type: ignore
+        )
+        assert params.test_type == test_type
 
 
 class TestBDDGenerationParams:
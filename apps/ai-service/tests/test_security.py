@@ -1,56 +1,94 @@
 """Tests for API key validation security module."""
 
-from unittest.mock import MagicMock
+import dis
+import hmac
+from typing import List, Optional
+from unittest.mock import patch
 
 import pytest
-from fastapi import HTTPException
-
-from app.core.security import verify_api_key
+from fastapi import APIRouter, FastAPI, HTTPException, Security
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings, hash_api_key
+from app.core.security import (
+    _matches_any,
+    _provided_key_digest,
+    make_verifier,
+    verify_api_key,
+)
+
+
+def _settings(api_keys: List[str], is_production: bool = False) -> Settings:
+    """Build Settings with the given API keys and environment."""
+    return Settings(
+        api_keys=api_keys,
+        environment="production" if is_production else "development",
+    )
+
+
+_REJECTION_CASES = [
+    pytest.param(None, ["k"], False, 401, "API key is required", id="missing"),
+    pytest.param("wrong-key", ["k"], False, 403, "Invalid API key", id="wrong"),
+    pytest.param("", ["k"], False, 403, "Invalid API key", id="empty"),
+    pytest.param("   ", ["k"], False, 403, "Invalid API key", id="whitespace"),
+    pytest.param(
+        "mysecretkey",
+        ["MySecretKey"],
+        False,
+        403,
+        "Invalid API key",
+        id="case-sensitive",
+    ),
+    pytest.param(
+        "k" * 999 + "x",
+        ["k" * 1000],
+        False,
+        403,
+        "Invalid API key",
+        id="long-key-last-char",
+    ),
+    pytest.param("any-key", [], True, 500, "not configured", id="production-no-keys"),
+    pytest.param(None, [], True, 500, "not configured", id="production-no-keys-missing"),
+    pytest.param("any-key", ["   "], True, 500, "not configured", id="production-blank-keys"),
+]
+
+
+@pytest.fixture(scope="module")
+def settings() -> Settings:
+    """Shared settings with a single configured API key."""
+    return _settings(["valid-key-123"])
 
 
 class TestVerifyApiKey:
     """Tests for the verify_api_key dependency."""
 
-    def test_missing_api_key_returns_401(self) -> None:
-        """Test that missing API key returns 401 Unauthorized."""
-        settings = MagicMock()
-        settings.api_keys = ["valid-key-123"]
-        settings.is_production = False
-
-        with pytest.raises(HTTPException) as exc_info:
-            verify_api_key(api_key=None, settings=settings)
-
-        assert exc_info.value.status_code == 401
-        assert "API key is required" in exc_info.value.detail
-
-    def test_invalid_api_key_returns_403(self) -> None:
-        """Test that invalid API key returns 403 Forbidden."""
-        settings = MagicMock()
-        settings.api_keys = ["valid-key-123"]
-        settings.is_production = False
+    @pytest.mark.parametrize("api_key,api_keys,is_production,status_code,detail", _REJECTION_CASES)
+    def test_rejected_api_key(
+        self,
+        api_key: Optional[str],
+        api_keys: List[str],
+        is_production: bool,
+        status_code: int,
+        detail: str,
+    ) -> None:
+        """Test that missing, invalid and unconfigured keys are rejected."""
+        settings = _settings(api_keys, is_production=is_production)
 
         with pytest.raises(HTTPException) as exc_info:
-            verify_api_key(api_key="wrong-key", settings=settings)
+            verify_api_key(api_key=api_key, settings=settings)
 
-        assert exc_info.value.status_code == 403
-        assert "Invalid API key" in exc_info.value.detail
+        assert exc_info.value.status_code == status_code
+        assert detail in exc_info.value.detail
 
-    def test_valid_api_key_returns_key(self) -> None:
+    def test_valid_api_key_returns_key(self, settings: Settings) -> None:
         """Test that valid API key returns the key."""
-        settings = MagicMock()
-        valid_key = "valid-key-123"
-        settings.api_keys = [valid_key]
-        settings.is_production = False
-
-        result = verify_api_key(api_key=valid_key, settings=settings)
+        result = verify_api_key(api_key="valid-key-123", settings=settings)
 
-        assert result == valid_key
+        assert result == "valid-key-123"
 
     def test_valid_api_key_from_multiple_keys(self) -> None:
         """Test validation with multiple configured keys."""
-        settings = MagicMock()
-        settings.api_keys = ["key-one", "key-two", "key-three"]
-        settings.is_production = False
+        settings = _settings(["key-one", "key-two", "key-three"])
 
         # Each key should be valid
         assert verify_api_key(api_key="key-one", settings=settings) == "key-one"
@@ -59,66 +97,192 @@ class TestVerifyApiKey:
 
     def test_no_keys_configured_development_allows_request(self) -> None:
         """Test that development mode allows requests when no keys configured."""
-        settings = MagicMock()
-        settings.api_keys = []
-        settings.is_production = False
+        settings = _settings([])
 
         # In development, any key should be allowed when none configured
-        result = verify_api_key(api_key="any-key", settings=settings)
-        assert result == "any-key"
+        with patch("app.core.security._compare_digest") as compare:
+            assert verify_api_key(api_key="any-key", settings=settings) == "any-key"
+            assert verify_api_key(api_key=None, settings=settings) is None
 
-    def test_no_keys_configured_production_returns_500(self) -> None:
-        """Test that production mode returns 500 when no keys configured."""
-        settings = MagicMock()
-        settings.api_keys = []
-        settings.is_production = True
-
-        with pytest.raises(HTTPException) as exc_info:
-            verify_api_key(api_key="any-key", settings=settings)
-
-        assert exc_info.value.status_code == 500
-        assert "not configured" in exc_info.value.detail
-
-    def test_api_key_comparison_is_case_sensitive(self) -> None:
-        """Test that API key comparison is case-sensitive."""
-        settings = MagicMock()
-        settings.api_keys = ["MySecretKey"]
-        settings.is_production = False
-
-        # Lowercase variant should fail
-        with pytest.raises(HTTPException) as exc_info:
-            verify_api_key(api_key="mysecretkey", settings=settings)
-
-        assert exc_info.value.status_code == 403
+        compare.assert_not_called()
 
     def test_api_key_with_special_characters(self) -> None:
         """Test that API keys with special characters work correctly."""
-        settings = MagicMock()
         special_key = "key-with.special_chars!@#$%"
-        settings.api_keys = [special_key]
-        settings.is_production = False
+        settings = _settings([special_key])
 
         result = verify_api_key(api_key=special_key, settings=settings)
         assert result == special_key
 
-    def test_empty_string_api_key_is_invalid(self) -> None:
-        """Test that empty string API key is invalid."""
-        settings = MagicMock()
-        settings.api_keys = ["valid-key"]
-        settings.is_production = False
+    def test_long_api_key(self) -> None:
+        """Test that keys much longer than the digest size are validated."""
+        long_key = "k" * 1000
+        settings = _settings([long_key])
+
+        assert verify_api_key(api_key=long_key, settings=settings) == long_key
+
+    def test_all_configured_keys_are_compared(self) -> None:
+        """Test that comparison does not stop at the first matching key."""
+        settings = _settings(["key-one", "key-two", "key-three"])
+
+        with patch("app.core.security._compare_digest", wraps=hmac.compare_digest) as compare:
+            verify_api_key(api_key="key-one", settings=settings)
+
+        assert compare.call_count == 3
+
+    def test_comparison_uses_bytes_like_digests(self) -> None:
+        """Test that compare_digest only ever receives bytes-like digests, never str."""
+        settings = _settings(["key-one", "key-two"])
+
+        with patch("app.core.security._compare_digest", wraps=hmac.compare_digest) as compare:
+            verify_api_key(api_key="key-two", settings=settings)
+
+        assert all(
+            isinstance(arg, (bytes, memoryview))
+            for call in compare.call_args_list
+            for arg in call.args
+        )
+
+    def test_blank_configured_key_does_not_match_blank_header(self) -> None:
+        """Test that a blank configured key does not admit blank headers."""
+        settings = Settings(api_keys=["", "valid-key"])
 
         with pytest.raises(HTTPException) as exc_info:
             verify_api_key(api_key="", settings=settings)
 
         assert exc_info.value.status_code == 403
 
-    def test_whitespace_only_api_key_is_invalid(self) -> None:
-        """Test that whitespace-only API key is invalid."""
-        settings = MagicMock()
-        settings.api_keys = ["valid-key"]
-        settings.is_production = False
+    def test_only_blank_configured_keys_count_as_not_configured(self) -> None:
+        """Test that production with only blank keys reports missing configuration."""
+        settings = Settings(api_keys=["   "], environment="production")
 
         with pytest.raises(HTTPException) as exc_info:
-            verify_api_key(api_key="   ", settings=settings)
+            verify_api_key(api_key="any-key", settings=settings)
 
-        assert exc_info.value.status_code == 403
+        assert exc_info.value.status_code == 500
+
+    def test_repeated_failures_do_not_grow_traceback(self, settings: Settings) -> None:
+        """Test that each rejection raises a fresh error with its own traceback."""
+        depths = []
+        errors = []
+        for _ in range(3):
+            with pytest.raises(HTTPException) as exc_info:
+                verify_api_key(api_key="wrong-key", settings=settings)
+            depths.append(len(exc_info.traceback))
+            errors.append(exc_info.value)
+
+        assert depths[0] == depths[1] == depths[2]
+        assert len({id(error) for error in errors}) == 3
+
+
+class TestMakeVerifier:
+    """Tests for the settings-specialized verifier."""
+
+    @pytest.mark.parametrize("api_key,api_keys,is_production,status_code,detail", _REJECTION_CASES)
+    def test_rejected_api_key(
+        self,
+        api_key: Optional[str],
+        api_keys: List[str],
+        is_production: bool,
+        status_code: int,
+        detail: str,
+    ) -> None:
+        """Test that the verifier rejects the same keys as verify_api_key."""
+        verify = make_verifier(_settings(api_keys, is_production=is_production))
+
+        with pytest.raises(HTTPException) as exc_info:
+            verify(api_key=api_key)
+
+        assert exc_info.value.status_code == status_code
+        assert detail in exc_info.value.detail
+
+    def test_valid_api_key_returns_key(self) -> None:
+        """Test that each configured key is accepted."""
+        verify = make_verifier(_settings(["key-one", "key-two"]))
+
+        assert verify(api_key="key-one") == "key-one"
+        assert verify(api_key="key-two") == "key-two"
+
+    def test_no_keys_configured_development_allows_request(self) -> None:
+        """Test that development mode allows requests when no keys configured."""
+        verify = make_verifier(_settings([]))
+
+        assert verify(api_key="any-key") == "any-key"
+        assert verify(api_key=None) is None
+
+    def test_enforced_through_route_security(self) -> None:
+        """Test that a route opts in to the verifier with an explicit Security."""
+        router = APIRouter(dependencies=[Security(make_verifier(_settings(["k"])))])
+
+        @router.get("/protected")
+        def protected() -> dict:
+            return {}
+
+        application = FastAPI()
+        application.include_router(router)
+        client = TestClient(application)
+
+        assert client.get("/protected").status_code == 401
+        assert client.get("/protected", headers={"X-API-Key": "wrong"}).status_code == 403
+        assert client.get("/protected", headers={"X-API-Key": "k"}).status_code == 200
+
+    def test_not_registered_as_override_on_app(self) -> None:
+        """Test that the application leaves verify_api_key unpatched."""
+        from app.main import app
+
+        assert verify_api_key not in app.dependency_overrides
+
+
+class TestMatchesAny:
+    """Tests for the constant-time digest comparison helper."""
+
+    def test_matches_configured_digest(self) -> None:
+        """Test that a digest present in the configured set matches."""
+        key_hashes = (hash_api_key("key-one"), hash_api_key("key-two"))
+
+        assert _matches_any(hash_api_key("key-two"), key_hashes) is True
+
+    def test_rejects_unknown_digest(self) -> None:
+        """Test that a digest absent from the configured set does not match."""
+        key_hashes = (hash_api_key("key-one"), hash_api_key("key-two"))
+
+        assert _matches_any(hash_api_key("key-three"), key_hashes) is False
+
+    def test_empty_key_set_never_matches(self) -> None:
+        """Test that nothing matches when no digests are configured."""
+        assert _matches_any(hash_api_key("key-one"), ()) is False
+
+    def test_provided_key_digest_is_cached(self) -> None:
+        """Test that repeated keys reuse the cached digest."""
+        _provided_key_digest.cache_clear()
+
+        first = _provided_key_digest("key-one")
+        second = _provided_key_digest("key-one")
+
+        assert first is second
+        assert first == hash_api_key("key-one")
+        assert _provided_key_digest.cache_info().hits == 1
+
+
+class TestConstantTimeInvariants:
+    """Bytecode checks guarding against timing-unsafe key comparison."""
+
+    @pytest.mark.parametrize(
+        "func",
+        [verify_api_key, make_verifier(_settings(["k"])), _matches_any],
+        ids=["verify_api_key", "make_verifier", "_matches_any"],
+    )
+    def test_no_direct_equality_on_secret(self, func: object) -> None:
+        """Test that key checks never use == or != (early-exit comparison)."""
+        instructions = dis.get_instructions(func)  # type: ignore[arg-type]
+
+        assert not any(
+            i.opname == "COMPARE_OP" and ("==" in str(i.argval) or "!=" in str(i.argval))
+            for i in instructions
+        ), "Use hmac.compare_digest, not == / !="
+
+    def test_comparison_uses_compare_digest(self) -> None:
+        """Test that the digest comparison goes through compare_digest."""
+        names = {i.argval for i in dis.get_instructions(_matches_any)}
+
+        assert "_compare_digest" in names
@@ -0,0 +1,42 @@
+"""Benchmarks for API key verification.
+
+Run with ``pytest tests/test_security_bench.py --benchmark-enable``. Timings
+should stay flat across matching-key positions for a given key count; a
+position-dependent spread means an early exit crept into the comparison.
+"""
+
+from typing import Optional
+
+import pytest
+from fastapi import HTTPException
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from app.core.config import Settings
+from app.core.security import verify_api_key
+
+
+def _verify(api_key: str, settings: Settings) -> Optional[str]:
+    """Verify a key, returning None instead of raising on rejection."""
+    try:
+        return verify_api_key(api_key=api_key, settings=settings)
+    except HTTPException:
+        return None
+
+
+@pytest.mark.parametrize("key_count", [1, 10, 100])
+@pytest.mark.parametrize("position", ["first", "last", "none"])
+def test_verify_api_key_benchmark(
+    benchmark: BenchmarkFixture, key_count: int, position: str
+) -> None:
+    """Benchmark verification by configured key count and match position."""
+    api_keys = [f"service-key-{i:04d}" for i in range(key_count)]
+    settings = Settings(api_keys=api_keys)
+    provided = {
+        "first": api_keys[0],
+        "last": api_keys[-1],
+        "none": "service-key-none",
+    }[position]
+
+    result = benchmark(_verify, provided, settings)
+
+    assert result == (None if position == "none" else provided)
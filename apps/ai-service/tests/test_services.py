@@ -1,448 +1,481 @@
 """Tests for service classes."""
 
+import asyncio
 import json
-from typing import Any, Dict
-from unittest.mock import AsyncMock, patch
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import pytest
+import pytest_asyncio
 
+from app.models.responses import BDDGenerationResponse, BDDScenario, TestGenerationResponse
+from app.services import _json
 from app.services.bdd_generator import BDDGenerationError, BDDGenerator
 from app.services.llm_client import LLMClientError, LLMResponse
 from app.services.test_generator import TestGenerationError, TestGenerator
 
 
+class FakeLLMClient:
+    """Minimal async stand-in for an LLM client that records its calls."""
+
+    def __init__(
+        self,
+        response: Optional[LLMResponse] = None,
+        exc: Optional[Exception] = None,
+    ) -> None:
+        self.response = response
+        self.exc = exc
+        self.calls: List[Dict[str, Any]] = []
+
+    async def complete_simple(self, **kwargs: Any) -> Optional[LLMResponse]:
+        """Record the call and return the canned response or raise."""
+        self.calls.append(kwargs)
+        if self.exc is not None:
+            raise self.exc
+        return self.response
+
+
+# Feature description shared by the AI-path tests, which only care that a
+# request is made, not what it describes.
+_FEATURE_DESCRIPTION = "User login feature"
+
+# Scenario names from the header lines of a Gherkin feature file.
+_SCENARIO_HEADER = re.compile(r"^\s*Scenario(?: Outline)?: (.+)$", re.MULTILINE)
+
+# Mock LLM payloads shared read-only by the fixtures below. The test case
+# payload is kept as a JSON literal since every consumer wants the raw text.
+_TEST_MOCK_JSON = """\
+[
+    {
+        "title": "Verify successful login with valid credentials",
+        "preconditions": "User account exists in the system",
+        "steps": [
+            {
+                "step_number": 1,
+                "action": "Navigate to login page",
+                "expected_result": "Login page is displayed"
+            },
+            {
+                "step_number": 2,
+                "action": "Enter valid email and password",
+                "expected_result": "Credentials are accepted"
+            },
+            {
+                "step_number": 3,
+                "action": "Click login button",
+                "expected_result": "User is redirected to dashboard"
+            }
+        ],
+        "expected_result": "User is successfully authenticated and logged in",
+        "priority": "critical",
+        "test_type": "functional"
+    },
+    {
+        "title": "Verify login fails with invalid password",
+        "preconditions": "User account exists in the system",
+        "steps": [
+            {
+                "step_number": 1,
+                "action": "Navigate to login page",
+                "expected_result": "Login page is displayed"
+            },
+            {
+                "step_number": 2,
+                "action": "Enter valid email with incorrect password",
+                "expected_result": "Credentials are entered"
+            },
+            {
+                "step_number": 3,
+                "action": "Click login button",
+                "expected_result": "Error message is displayed"
+            }
+        ],
+        "expected_result": "Authentication fails with appropriate error message",
+        "priority": "high",
+        "test_type": "negative"
+    }
+]
+"""
+_TEST_MOCK_JSON_WRAPPED = f"```json\n{_TEST_MOCK_JSON}\n```"
+_TEST_MOCK_OBJECT_JSON = f'{{"test_cases":{_TEST_MOCK_JSON}}}'
+
+_BDD_MOCK_DATA: Dict[str, Any] = {
+    "feature_name": "User Authentication",
+    "scenarios": [
+        {
+            "name": "Successful login with valid credentials",
+            "tags": ["@smoke", "@login"],
+            "given": [
+                "the user is on the login page",
+                "the user has a valid account",
+            ],
+            "when": [
+                "the user enters valid email and password",
+                "the user clicks the login button",
+            ],
+            "then": [
+                "the user should be redirected to the dashboard",
+                "the user should see a welcome message",
+            ],
+            "examples": None,
+        },
+        {
+            "name": "Login with various credentials",
+            "tags": ["@validation", "@regression"],
+            "given": ["the user is on the login page"],
+            "when": [
+                "the user enters <email> and <password>",
+                "the user clicks the login button",
+            ],
+            "then": ["the system should show <result>"],
+            "examples": [
+                {"email": "valid@test.com", "password": "pass123", "result": "success"},
+                {"email": "invalid", "password": "pass123", "result": "error"},
+                {"email": "valid@test.com", "password": "", "result": "error"},
+            ],
+        },
+    ],
+}
+_BDD_MOCK_JSON = _json.dumps(_BDD_MOCK_DATA)
+_BDD_MOCK_JSON_WRAPPED = f"```json\n{_BDD_MOCK_JSON}\n```"
+_BDD_ARRAY_JSON = _json.dumps([
+    {
+        "name": "Test scenario",
+        "given": ["precondition"],
+        "when": ["action"],
+        "then": ["outcome"],
+    }
+])
+
+
+@pytest.fixture(scope="session")
+def mock_llm_response_json() -> str:
+    """Mock LLM test case data serialized as JSON."""
+    return _TEST_MOCK_JSON
+
+
+@pytest.fixture(scope="session")
+def mock_llm_response_data_json() -> str:
+    """Mock LLM BDD scenario data serialized as JSON."""
+    return _BDD_MOCK_JSON
+
+
+@pytest.fixture(scope="module")
+def mock_test_generator() -> TestGenerator:
+    """Mock-mode TestGenerator shared by the generation and parsing tests."""
+    return TestGenerator(use_ai=False)
+
+
+@pytest.fixture(scope="module")
+def mock_bdd_generator() -> BDDGenerator:
+    """Mock-mode BDDGenerator shared by the generation, parsing and formatting tests."""
+    return BDDGenerator(use_ai=False)
+
+
+# generate() arguments for each TestTestGenerator case, keyed by case id. The
+# bundle carries every compatible constraint so one result serves most tests;
+# max_tests needs its own unfiltered request, since filtering to one test type
+# already leaves fewer cases than the limit.
+_TEST_GENERATE_CASES: Dict[str, Dict[str, Any]] = {
+    "bundle": {
+        "description": "Payment processing feature",
+        "test_type": "functional",
+        "priority": "critical",
+        "max_tests": 5,
+    },
+    "max_tests": {"description": "Shopping cart functionality", "max_tests": 2},
+    "unfiltered": {
+        "description": "User registration flow",
+        "test_type": "all",
+        "priority": "critical",
+    },
+}
+
+
+@pytest.mark.xdist_group(name="test_generator")
 class TestTestGenerator:
     """Tests for the TestGenerator service."""
 
-    @pytest.fixture
-    def generator(self) -> TestGenerator:
-        """Create a TestGenerator instance with mock mode enabled."""
-        return TestGenerator(use_ai=False)
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    async def all_results(
+        self, mock_test_generator: TestGenerator
+    ) -> Dict[str, TestGenerationResponse]:
+        """Run every generate() case concurrently once; tests only inspect the results."""
+        results = await asyncio.gather(
+            *(mock_test_generator.generate(**case) for case in _TEST_GENERATE_CASES.values())
+        )
+        return dict(zip(_TEST_GENERATE_CASES, results, strict=True))
+
+    @pytest.mark.parametrize(
+        "case,check",
+        [
+            pytest.param("bundle", lambda r: len(r.test_cases) > 0, id="returns-test-cases"),
+            pytest.param("max_tests", lambda r: len(r.test_cases) <= 2, id="respects-max-tests"),
+            pytest.param(
+                "bundle",
+                lambda r: all(tc.test_type == "functional" for tc in r.test_cases),
+                id="filters-by-test-type",
+            ),
+            pytest.param(
+                "unfiltered",
+                lambda r: len({tc.test_type for tc in r.test_cases}) > 1
+                and all(tc.priority == "critical" for tc in r.test_cases),
+                id="applies-priority",
+            ),
+            pytest.param(
+                "bundle",
+                lambda r: {"provider", "description_length"} <= r.metadata.keys(),
+                id="includes-metadata",
+            ),
+            pytest.param(
+                "unfiltered",
+                lambda r: all(
+                    tc.steps and tc.steps[0].step_number >= 1 and tc.steps[0].action
+                    for tc in r.test_cases
+                ),
+                id="test-cases-have-steps",
+            ),
+        ],
+    )
+    def test_generate(
+        self,
+        all_results: Dict[str, TestGenerationResponse],
+        case: str,
+        check: Callable[[TestGenerationResponse], bool],
+    ) -> None:
+        """Test that each generated result satisfies its property check."""
+        assert check(all_results[case])
 
-    @pytest.fixture
-    def ai_generator(self) -> TestGenerator:
-        """Create a TestGenerator instance with AI enabled."""
-        return TestGenerator(api_key="test-key", provider="openai", use_ai=True)
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_responses_do_not_share_steps(self) -> None:
+        """Test that mutating one mock test case leaves later responses untouched."""
+        first = await TestGenerator(use_ai=False).generate(description="Form validation feature")
+        first.test_cases[0].steps[0].action = "MUTATED"
 
-    @pytest.mark.asyncio
-    async def test_generate_returns_test_cases(self, generator: TestGenerator) -> None:
-        """Test that generate returns test cases."""
-        result = await generator.generate(
-            description="User authentication with OAuth2",
-            max_tests=3,
-        )
+        second = await TestGenerator(use_ai=False).generate(description="Form validation feature")
 
-        assert result.test_cases is not None
-        assert len(result.test_cases) > 0
+        assert second.test_cases[0].steps[0].action != "MUTATED"
 
-    @pytest.mark.asyncio
-    async def test_generate_respects_max_tests(self, generator: TestGenerator) -> None:
-        """Test that generate respects max_tests limit."""
-        result = await generator.generate(
-            description="Shopping cart functionality",
-            max_tests=2,
-        )
 
-        assert len(result.test_cases) <= 2
+def _llm_response(content: str) -> LLMResponse:
+    """Build a successful LLM response with fixed model and token counts."""
+    return LLMResponse(
+        content=content,
+        model="gpt-4-turbo-preview",
+        prompt_tokens=100,
+        completion_tokens=200,
+        total_tokens=300,
+        finish_reason="stop",
+    )
 
-    @pytest.mark.asyncio
-    async def test_generate_filters_by_test_type(self, generator: TestGenerator) -> None:
-        """Test that generate filters by test type."""
-        result = await generator.generate(
-            description="Payment processing feature",
-            test_type="functional",
-            max_tests=5,
-        )
 
-        for test_case in result.test_cases:
-            assert test_case.test_type == "functional"
+@pytest.fixture(scope="module")
+def shared_llm_response(mock_llm_response_json: str) -> LLMResponse:
+    """LLM response carrying the mock test cases, built once per module."""
+    return _llm_response(mock_llm_response_json)
 
-    @pytest.mark.asyncio
-    async def test_generate_applies_priority(self, generator: TestGenerator) -> None:
-        """Test that generate applies specified priority."""
-        result = await generator.generate(
-            description="Security critical feature",
-            priority="critical",
-            max_tests=3,
-        )
 
-        for test_case in result.test_cases:
-            assert test_case.priority == "critical"
+@pytest.fixture(scope="module")
+def shared_object_llm_response() -> LLMResponse:
+    """LLM response wrapping the mock test cases in a test_cases object."""
+    return _llm_response(_TEST_MOCK_OBJECT_JSON)
 
-    @pytest.mark.asyncio
-    async def test_generate_includes_metadata(self, generator: TestGenerator) -> None:
-        """Test that generate includes metadata."""
-        result = await generator.generate(
-            description="API endpoint testing",
-        )
 
-        assert "provider" in result.metadata
-        assert "description_length" in result.metadata
+@pytest.fixture(scope="module")
+def shared_bdd_llm_response(mock_llm_response_data_json: str) -> LLMResponse:
+    """LLM response carrying the mock BDD scenarios, built once per module."""
+    return _llm_response(mock_llm_response_data_json)
 
-    @pytest.mark.asyncio
-    async def test_generate_test_cases_have_steps(self, generator: TestGenerator) -> None:
-        """Test that generated test cases have steps."""
-        result = await generator.generate(
-            description="Form validation feature",
-            max_tests=1,
-        )
 
-        test_case = result.test_cases[0]
-        assert len(test_case.steps) > 0
-        assert test_case.steps[0].step_number >= 1
-        assert test_case.steps[0].action != ""
+@pytest.fixture(scope="module")
+def shared_bdd_mock_client(shared_bdd_llm_response: LLMResponse) -> FakeLLMClient:
+    """Mocked LLM client returning the BDD response, built once per module.
 
+    Tests must call calls.clear() before use so call
+    assertions only see their own calls.
+    """
+    return FakeLLMClient(response=shared_bdd_llm_response)
 
-class TestTestGeneratorGenerateTests:
-    """Tests for TestGenerator.generate_tests method with AI integration."""
 
-    @pytest.fixture
-    def mock_llm_response(self) -> Dict[str, Any]:
-        """Create mock LLM response data."""
-        return [
-            {
-                "title": "Verify successful login with valid credentials",
-                "preconditions": "User account exists in the system",
-                "steps": [
-                    {
-                        "step_number": 1,
-                        "action": "Navigate to login page",
-                        "expected_result": "Login page is displayed",
-                    },
-                    {
-                        "step_number": 2,
-                        "action": "Enter valid email and password",
-                        "expected_result": "Credentials are accepted",
-                    },
-                    {
-                        "step_number": 3,
-                        "action": "Click login button",
-                        "expected_result": "User is redirected to dashboard",
-                    },
-                ],
-                "expected_result": "User is successfully authenticated and logged in",
-                "priority": "critical",
-                "test_type": "functional",
-            },
-            {
-                "title": "Verify login fails with invalid password",
-                "preconditions": "User account exists in the system",
-                "steps": [
-                    {
-                        "step_number": 1,
-                        "action": "Navigate to login page",
-                        "expected_result": "Login page is displayed",
-                    },
-                    {
-                        "step_number": 2,
-                        "action": "Enter valid email with incorrect password",
-                        "expected_result": "Credentials are entered",
-                    },
-                    {
-                        "step_number": 3,
-                        "action": "Click login button",
-                        "expected_result": "Error message is displayed",
-                    },
-                ],
-                "expected_result": "Authentication fails with appropriate error message",
-                "priority": "high",
-                "test_type": "negative",
-            },
-        ]
+@pytest.fixture(scope="module")
+def mock_client_factory() -> Callable[[str], FakeLLMClient]:
+    """Factory for mocked LLM clients returning arbitrary response content."""
 
-    @pytest.fixture
-    def generator(self) -> TestGenerator:
-        """Create a TestGenerator with AI enabled."""
-        return TestGenerator(api_key="test-key", provider="openai", use_ai=True)
+    def make(content: str) -> FakeLLMClient:
+        return FakeLLMClient(response=_llm_response(content))
 
-    @pytest.mark.asyncio
-    async def test_generate_tests_calls_llm(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests calls the LLM client."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
+    return make
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_tests(
-                description="User login with email and password",
-                max_tests=5,
-            )
+async def _run_case(
+    mock_response: LLMResponse, **kwargs: Any
+) -> Tuple[Any, FakeLLMClient]:
+    """Run generate_tests on a fresh AI-enabled generator with a mocked client.
 
-            mock_client.complete_simple.assert_called_once()
-            assert len(result.test_cases) == 2
-            assert result.test_cases[0].title == "Verify successful login with valid credentials"
+    Each case gets its own generator and client so cases can be awaited
+    concurrently with asyncio.gather.
 
-    @pytest.mark.asyncio
-    async def test_generate_tests_includes_metadata(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests includes comprehensive metadata."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
+    Args:
+        mock_response: The LLM response returned by the mocked client.
+        **kwargs: Arguments passed through to generate_tests.
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+    Returns:
+        Tuple of (generation result, mocked LLM client).
+    """
+    generator = TestGenerator(api_key="test-key", provider="openai", use_ai=True)
+    mock_client = FakeLLMClient(response=mock_response)
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_tests(
-                description="User login feature",
-                max_tests=5,
-            )
+    generator._get_client = lambda: mock_client
+    result = await generator.generate_tests(**kwargs)
 
-            assert result.metadata["provider"] == "openai"
-            assert result.metadata["model"] == "gpt-4-turbo-preview"
-            assert result.metadata["prompt_tokens"] == 100
-            assert result.metadata["completion_tokens"] == 200
-            assert result.metadata["total_tokens"] == 300
+    return result, mock_client
 
-    @pytest.mark.asyncio
-    async def test_generate_tests_filters_by_type(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests filters results by test type."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+@pytest.mark.xdist_group(name="test_generator_ai")
+class TestTestGeneratorGenerateTests:
+    """Tests for TestGenerator.generate_tests method with AI integration."""
+
+    @pytest.fixture(scope="class")
+    def generator(self) -> TestGenerator:
+        """Create a TestGenerator with AI enabled, shared by the tests in this class.
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_tests(
-                description="User login feature",
+        Each test installs its own ``_get_client`` stub before generating.
+        """
+        return TestGenerator(api_key="test-key", provider="openai", use_ai=True)
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_tests_matrix(self, shared_llm_response: LLMResponse) -> None:
+        """Test LLM call, metadata, filtering, limits and prompt options concurrently."""
+        (
+            (result, mock_client),
+            (filtered, _),
+            (limited, _),
+            (_, context_client),
+        ) = await asyncio.gather(
+            _run_case(
+                shared_llm_response,
+                description="User login with email and password",
+                max_tests=5,
+            ),
+            _run_case(
+                shared_llm_response,
+                description=_FEATURE_DESCRIPTION,
                 test_type="functional",
                 max_tests=5,
-            )
+            ),
+            _run_case(shared_llm_response, description=_FEATURE_DESCRIPTION, max_tests=1),
+            _run_case(
+                shared_llm_response,
+                description=_FEATURE_DESCRIPTION,
+                context="This is a banking application with strict security requirements",
+                max_tests=5,
+            ),
+        )
 
-            assert len(result.test_cases) == 1
-            assert result.test_cases[0].test_type == "functional"
+        # Calls the LLM once, in JSON mode
+        assert len(mock_client.calls) == 1
+        assert mock_client.calls[0]["json_mode"] is True
+        assert len(result.test_cases) == 2
+        assert result.test_cases[0].title == "Verify successful login with valid credentials"
 
-    @pytest.mark.asyncio
-    async def test_generate_tests_respects_max_tests(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests limits results to max_tests."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
+        # Includes comprehensive metadata
+        assert result.metadata["provider"] == "openai"
+        assert result.metadata["model"] == "gpt-4-turbo-preview"
+        assert result.metadata["prompt_tokens"] == 100
+        assert result.metadata["completion_tokens"] == 200
+        assert result.metadata["total_tokens"] == 300
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        # Filters by test type
+        assert len(filtered.test_cases) == 1
+        assert filtered.test_cases[0].test_type == "functional"
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_tests(
-                description="User login feature",
-                max_tests=1,
-            )
+        # Respects max_tests
+        assert len(limited.test_cases) == 1
+
+        # Passes context to the prompt
+        assert "banking application" in context_client.calls[0]["user_prompt"]
 
-            assert len(result.test_cases) == 1
+        # Request-specific text stays in the user prompt, so the system prompt is
+        # an identical leading prefix that providers can serve from their cache
+        assert context_client.calls[0]["system_prompt"] == mock_client.calls[0]["system_prompt"]
 
-    @pytest.mark.asyncio
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_tests_handles_llm_error(
         self, generator: TestGenerator
     ) -> None:
         """Test that generate_tests handles LLM errors gracefully."""
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(
-            side_effect=LLMClientError("API error")
-        )
+        mock_client = FakeLLMClient(exc=LLMClientError("API error"))
 
-        with (
-            patch.object(generator, "_get_client", return_value=mock_client),
-            pytest.raises(TestGenerationError, match="AI provider error"),
-        ):
+        generator._get_client = lambda: mock_client
+
+        with pytest.raises(TestGenerationError, match="AI provider error"):
             await generator.generate_tests(
-                description="User login feature",
+                description=_FEATURE_DESCRIPTION,
             )
 
-    @pytest.mark.asyncio
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_tests_handles_invalid_json(
-        self, generator: TestGenerator
+        self,
+        generator: TestGenerator,
+        mock_client_factory: Callable[[str], FakeLLMClient],
     ) -> None:
         """Test that generate_tests handles invalid JSON responses."""
-        mock_response = LLMResponse(
-            content="not valid json",
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150,
-            finish_reason="stop",
-        )
+        mock_client = mock_client_factory("not valid json")
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator._get_client = lambda: mock_client
 
-        with (
-            patch.object(generator, "_get_client", return_value=mock_client),
-            pytest.raises(TestGenerationError, match="Failed to parse"),
-        ):
+        with pytest.raises(TestGenerationError, match="Failed to parse"):
             await generator.generate_tests(
-                description="User login feature",
+                description=_FEATURE_DESCRIPTION,
             )
 
-    @pytest.mark.asyncio
-    async def test_generate_tests_handles_markdown_code_blocks(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests handles JSON wrapped in markdown code blocks."""
-        wrapped_content = f"```json\n{json.dumps(mock_llm_response)}\n```"
-
-        mock_response = LLMResponse(
-            content=wrapped_content,
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
-
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
-
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_tests(
-                description="User login feature",
-                max_tests=5,
-            )
-
-            assert len(result.test_cases) == 2
-
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_tests_handles_object_response(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
+        self, generator: TestGenerator, shared_object_llm_response: LLMResponse
     ) -> None:
         """Test that generate_tests handles object with test_cases key."""
-        object_response = {"test_cases": mock_llm_response}
-
-        mock_response = LLMResponse(
-            content=json.dumps(object_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
-
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
-
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_tests(
-                description="User login feature",
-                max_tests=5,
-            )
-
-            assert len(result.test_cases) == 2
-
-    @pytest.mark.asyncio
-    async def test_generate_tests_with_context(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests passes context to the prompt."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=150,
-            completion_tokens=200,
-            total_tokens=350,
-            finish_reason="stop",
-        )
-
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
-
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            await generator.generate_tests(
-                description="User login feature",
-                context="This is a banking application with strict security requirements",
-                max_tests=5,
-            )
+        mock_client = FakeLLMClient(response=shared_object_llm_response)
 
-            # Verify context was passed to prompt
-            call_args = mock_client.complete_simple.call_args
-            user_prompt = call_args[1]["user_prompt"]
-            assert "banking application" in user_prompt
+        generator._get_client = lambda: mock_client
 
-    @pytest.mark.asyncio
-    async def test_generate_tests_uses_json_mode(
-        self, generator: TestGenerator, mock_llm_response: Dict[str, Any]
-    ) -> None:
-        """Test that generate_tests uses JSON mode for LLM calls."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
+        result = await generator.generate_tests(
+            description=_FEATURE_DESCRIPTION,
+            max_tests=5,
         )
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
-
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            await generator.generate_tests(
-                description="User login feature",
-            )
-
-            call_args = mock_client.complete_simple.call_args
-            assert call_args[1]["json_mode"] is True
-
-
-class TestTestGeneratorParsing:
-    """Tests for TestGenerator response parsing."""
-
-    def test_parse_response_array(self) -> None:
-        """Test parsing a JSON array response."""
-        generator = TestGenerator(use_ai=False)
-        content = json.dumps([
-            {
-                "title": "Test case 1",
-                "steps": [
-                    {"step_number": 1, "action": "Do something", "expected_result": "Result"}
-                ],
-                "expected_result": "Overall result",
-                "priority": "high",
-                "test_type": "functional",
-            }
-        ])
-
-        test_cases = generator._parse_response(content)
-
-        assert len(test_cases) == 1
-        assert test_cases[0].title == "Test case 1"
-        assert test_cases[0].priority == "high"
-
-    def test_parse_response_with_test_cases_key(self) -> None:
-        """Test parsing a response with test_cases key."""
-        generator = TestGenerator(use_ai=False)
-        content = json.dumps({
+        assert len(result.test_cases) == 2
+
+
+def _test_case_json(**overrides: Any) -> str:
+    """Serialize a single-element test case array for parsing tests."""
+    test_case = {
+        "title": "Test",
+        "steps": [],
+        "expected_result": "Result",
+        "priority": "high",
+        "test_type": "functional",
+    }
+    test_case.update(overrides)
+    return _json.dumps([{k: v for k, v in test_case.items() if v is not None}])
+
+
+# (content, expected test case count, expected fields of the first test case).
+# Serialized once at import time rather than in each test.
+_TEST_PARSE_CASES = [
+    pytest.param(
+        _test_case_json(
+            title="Test case 1",
+            steps=[{"step_number": 1, "action": "Do something", "expected_result": "Result"}],
+            expected_result="Overall result",
+        ),
+        1,
+        {"title": "Test case 1", "priority": "high"},
+        id="array",
+    ),
+    pytest.param(
+        _json.dumps({
             "test_cases": [
                 {
                     "title": "Test case 1",
@@ -452,556 +485,584 @@ class TestTestGeneratorParsing:
                     "test_type": "functional",
                 }
             ]
-        })
-
-        test_cases = generator._parse_response(content)
-
-        assert len(test_cases) == 1
-
-    def test_parse_response_strips_code_blocks(self) -> None:
-        """Test that code blocks are stripped from response."""
-        generator = TestGenerator(use_ai=False)
-        content = "```json\n[{\"title\": \"Test\", \"steps\": [], \"expected_result\": \"R\", \"priority\": \"low\", \"test_type\": \"functional\"}]\n```"
-
-        test_cases = generator._parse_response(content)
-
-        assert len(test_cases) == 1
-        assert test_cases[0].title == "Test"
-
-    def test_parse_response_normalizes_invalid_priority(self) -> None:
-        """Test that invalid priority is normalized to medium."""
-        generator = TestGenerator(use_ai=False)
-        content = json.dumps([
-            {
-                "title": "Test",
-                "steps": [],
-                "expected_result": "Result",
-                "priority": "invalid",
-                "test_type": "functional",
-            }
-        ])
+        }),
+        1,
+        {"title": "Test case 1"},
+        id="test-cases-key",
+    ),
+    pytest.param(
+        "```json\n[{\"title\": \"Test\", \"steps\": [], \"expected_result\": \"R\", "
+        "\"priority\": \"low\", \"test_type\": \"functional\"}]\n```",
+        1,
+        {"title": "Test"},
+        id="strips-code-blocks",
+    ),
+    pytest.param(
+        _TEST_MOCK_JSON_WRAPPED,
+        2,
+        {"title": "Verify successful login with valid credentials"},
+        id="strips-code-blocks-multiline",
+    ),
+    pytest.param(
+        _test_case_json(priority="invalid"),
+        1,
+        {"priority": "medium"},
+        id="normalizes-invalid-priority",
+    ),
+    pytest.param(
+        _test_case_json(test_type="unknown"),
+        1,
+        {"test_type": "functional"},
+        id="normalizes-invalid-test-type",
+    ),
+    pytest.param(
+        _test_case_json(
+            steps=[
+                {"action": "Step 1", "expected_result": "Result 1"},
+                {"action": "Step 2", "expected_result": "Result 2"},
+            ]
+        ),
+        1,
+        {
+            "steps": [
+                {"step_number": 1, "action": "Step 1", "expected_result": "Result 1"},
+                {"step_number": 2, "action": "Step 2", "expected_result": "Result 2"},
+            ]
+        },
+        id="default-step-numbers",
+    ),
+]
+_TEST_MISSING_TITLE_JSON = _test_case_json(title=None)
 
-        test_cases = generator._parse_response(content)
 
-        assert test_cases[0].priority == "medium"
+@pytest.mark.xdist_group(name="test_generator_parsing")
+class TestTestGeneratorParsing:
+    """Tests for TestGenerator response parsing."""
 
-    def test_parse_response_normalizes_invalid_test_type(self) -> None:
-        """Test that invalid test_type is normalized to functional."""
-        generator = TestGenerator(use_ai=False)
-        content = json.dumps([
-            {
-                "title": "Test",
-                "steps": [],
-                "expected_result": "Result",
-                "priority": "high",
-                "test_type": "unknown",
-            }
-        ])
+    @pytest.mark.parametrize("content,count,expected", _TEST_PARSE_CASES)
+    def test_parse_response(
+        self,
+        mock_test_generator: TestGenerator,
+        content: str,
+        count: int,
+        expected: Dict[str, Any],
+    ) -> None:
+        """Test that responses are parsed and normalized into test cases."""
+        test_cases = mock_test_generator._parse_response(content)
 
-        test_cases = generator._parse_response(content)
+        assert len(test_cases) == count
+        first = test_cases[0].model_dump()
+        assert {key: first[key] for key in expected} == expected
 
-        assert test_cases[0].test_type == "functional"
+    def test_parse_response_invalid_json_raises(self, mock_test_generator: TestGenerator) -> None:
+        """Test that non-JSON content raises a decode error."""
+        with pytest.raises(ValueError):
+            mock_test_generator._parse_response("not valid json")
 
-    def test_parse_response_missing_title_raises(self) -> None:
+    def test_parse_response_missing_title_raises(self, mock_test_generator: TestGenerator) -> None:
         """Test that missing title raises ValueError."""
-        generator = TestGenerator(use_ai=False)
-        content = json.dumps([
-            {
-                "steps": [],
-                "expected_result": "Result",
-                "priority": "high",
-                "test_type": "functional",
-            }
-        ])
-
         with pytest.raises(ValueError, match="missing required field: title"):
-            generator._parse_response(content)
-
-    def test_parse_response_default_step_numbers(self) -> None:
-        """Test that step numbers default to sequential if missing."""
-        generator = TestGenerator(use_ai=False)
-        content = json.dumps([
-            {
-                "title": "Test",
-                "steps": [
-                    {"action": "Step 1", "expected_result": "Result 1"},
-                    {"action": "Step 2", "expected_result": "Result 2"},
-                ],
-                "expected_result": "Result",
-                "priority": "high",
-                "test_type": "functional",
-            }
-        ])
-
-        test_cases = generator._parse_response(content)
-
-        assert test_cases[0].steps[0].step_number == 1
-        assert test_cases[0].steps[1].step_number == 2
+            mock_test_generator._parse_response(_TEST_MISSING_TITLE_JSON)
 
 
+@pytest.mark.xdist_group(name="bdd_generator")
 class TestBDDGenerator:
     """Tests for the BDDGenerator service."""
 
-    @pytest.fixture
-    def generator(self) -> BDDGenerator:
-        """Create a BDDGenerator instance with mock mode enabled."""
-        return BDDGenerator(use_ai=False)
-
-    @pytest.mark.asyncio
-    async def test_generate_returns_scenarios(self, generator: BDDGenerator) -> None:
-        """Test that generate returns BDD scenarios."""
-        result = await generator.generate(
-            feature_description="User registration with email verification",
-            max_scenarios=3,
+    @pytest_asyncio.fixture(scope="class", loop_scope="session")
+    async def all_results(
+        self, mock_bdd_generator: BDDGenerator
+    ) -> Dict[str, BDDGenerationResponse]:
+        """Run every generate() case concurrently once; tests only inspect the results."""
+        default, limited = await asyncio.gather(
+            mock_bdd_generator.generate(feature_description="Order checkout process"),
+            mock_bdd_generator.generate(
+                feature_description="Product catalog browsing", max_scenarios=2
+            ),
         )
+        return {"default": default, "max_scenarios": limited}
 
-        assert result.scenarios is not None
-        assert len(result.scenarios) > 0
+    @pytest.fixture(scope="class")
+    def default_result(
+        self, all_results: Dict[str, BDDGenerationResponse]
+    ) -> BDDGenerationResponse:
+        """Result generated with default options."""
+        return all_results["default"]
 
-    @pytest.mark.asyncio
-    async def test_generate_respects_max_scenarios(self, generator: BDDGenerator) -> None:
-        """Test that generate respects max_scenarios limit."""
-        result = await generator.generate(
-            feature_description="Product catalog browsing",
-            max_scenarios=2,
-        )
+    def test_generate_returns_scenarios(self, default_result: BDDGenerationResponse) -> None:
+        """Test that generate returns BDD scenarios."""
+        assert default_result.scenarios is not None
+        assert len(default_result.scenarios) > 0
 
-        assert len(result.scenarios) <= 2
+    def test_generate_respects_max_scenarios(
+        self, all_results: Dict[str, BDDGenerationResponse]
+    ) -> None:
+        """Test that generate respects max_scenarios limit."""
+        assert len(all_results["max_scenarios"].scenarios) <= 2
 
-    @pytest.mark.asyncio
-    async def test_generate_returns_gherkin(self, generator: BDDGenerator) -> None:
+    def test_generate_returns_gherkin(self, default_result: BDDGenerationResponse) -> None:
         """Test that generate returns Gherkin format."""
-        result = await generator.generate(
-            feature_description="Order checkout process",
-        )
-
-        assert result.gherkin is not None
-        assert "Feature:" in result.gherkin
-        assert "Scenario" in result.gherkin
+        assert default_result.gherkin is not None
+        assert "Feature:" in default_result.gherkin
+        assert "Scenario" in default_result.gherkin
 
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_have_given_when_then(
-        self, generator: BDDGenerator
+    def test_generate_scenarios_have_given_when_then(
+        self, default_result: BDDGenerationResponse
     ) -> None:
         """Test that scenarios have Given/When/Then steps."""
-        result = await generator.generate(
-            feature_description="Search functionality",
-        )
-
-        scenario = result.scenarios[0]
+        scenario = default_result.scenarios[0]
         assert len(scenario.given) > 0
         assert len(scenario.when) > 0
         assert len(scenario.then) > 0
 
-    @pytest.mark.asyncio
-    async def test_generate_extracts_feature_name(self, generator: BDDGenerator) -> None:
+    def test_generate_extracts_feature_name(
+        self, default_result: BDDGenerationResponse
+    ) -> None:
         """Test that feature name is extracted from description."""
-        result = await generator.generate(
-            feature_description="User login with two-factor authentication support",
-        )
+        assert default_result.feature_name == "Order checkout process"
 
-        assert result.feature_name is not None
-        assert len(result.feature_name) > 0
-
-    @pytest.mark.asyncio
-    async def test_generate_gherkin_contains_all_scenarios(
-        self, generator: BDDGenerator
+    def test_generate_gherkin_contains_all_scenarios(
+        self, default_result: BDDGenerationResponse
     ) -> None:
-        """Test that Gherkin output contains all generated scenarios."""
-        result = await generator.generate(
-            feature_description="File upload feature",
-            max_scenarios=3,
+        """Test that Gherkin output has a scenario header for every generated scenario."""
+        names = set(_SCENARIO_HEADER.findall(default_result.gherkin))
+
+        for scenario in default_result.scenarios:
+            assert scenario.name in names
+
+    def test_response_flags_follow_scenarios(self) -> None:
+        """Test that has_tags/has_examples follow the scenarios and are not serialized."""
+        outline = BDDScenario(
+            name="Login with various credentials",
+            tags=["@validation"],
+            given=["the user is on the login page"],
+            when=["the user enters <email>"],
+            then=["the system should show <result>"],
+            examples=[{"email": "valid@test.com", "result": "success"}],
         )
+        plain = outline.model_copy(update={"tags": None, "examples": None})
 
-        for scenario in result.scenarios:
-            assert scenario.name in result.gherkin
+        tagged = BDDGenerationResponse(
+            feature_name="Login",
+            feature_description="Login",
+            scenarios=[outline],
+            gherkin="",
+        )
+        untagged = tagged.model_copy(update={"scenarios": [plain]})
+
+        assert tagged.has_tags and tagged.has_examples
+        assert not untagged.has_tags and not untagged.has_examples
+        assert "has_tags" not in tagged.model_dump()
+        assert "has_examples" not in tagged.model_dump()
 
 
+@pytest.mark.xdist_group(name="generator_init")
 class TestGeneratorInitialization:
     """Tests for generator initialization."""
 
-    def test_test_generator_accepts_api_key(self) -> None:
-        """Test that TestGenerator accepts API key."""
-        generator = TestGenerator(api_key="test-key", provider="openai")
-        assert generator.api_key == "test-key"
-        assert generator.provider == "openai"
-
-    def test_bdd_generator_accepts_api_key(self) -> None:
-        """Test that BDDGenerator accepts API key."""
-        generator = BDDGenerator(api_key="test-key", provider="anthropic")
-        assert generator.api_key == "test-key"
-        assert generator.provider == "anthropic"
-
-    def test_test_generator_defaults(self) -> None:
-        """Test that TestGenerator has sensible defaults."""
-        generator = TestGenerator()
-        assert generator.api_key is None
-        assert generator.provider == "openai"
-
-    def test_bdd_generator_defaults(self) -> None:
-        """Test that BDDGenerator has sensible defaults."""
-        generator = BDDGenerator()
-        assert generator.api_key is None
-        assert generator.provider == "openai"
+    @pytest.mark.parametrize(
+        "cls,kwargs,expected",
+        [
+            pytest.param(
+                TestGenerator,
+                {"api_key": "test-key", "provider": "openai"},
+                {"api_key": "test-key", "provider": "openai"},
+                id="test-generator-api-key",
+            ),
+            pytest.param(
+                BDDGenerator,
+                {"api_key": "test-key", "provider": "anthropic"},
+                {"api_key": "test-key", "provider": "anthropic"},
+                id="bdd-generator-api-key",
+            ),
+            pytest.param(
+                TestGenerator,
+                {},
+                {"api_key": None, "provider": "openai"},
+                id="test-generator-defaults",
+            ),
+            pytest.param(
+                BDDGenerator,
+                {},
+                {"api_key": None, "provider": "openai", "use_cache": False},
+                id="bdd-generator-defaults",
+            ),
+            pytest.param(
+                BDDGenerator,
+                {"use_ai": False},
+                {"use_ai": False},
+                id="bdd-generator-use-ai-flag",
+            ),
+            pytest.param(
+                BDDGenerator,
+                {"use_cache": True},
+                {"use_cache": True},
+                id="bdd-generator-use-cache-flag",
+            ),
+        ],
+    )
+    def test_generator_init(
+        self, cls: type, kwargs: Dict[str, Any], expected: Dict[str, Any]
+    ) -> None:
+        """Test that generators store constructor arguments and sensible defaults."""
+        generator = cls(**kwargs)
 
-    def test_bdd_generator_use_ai_flag(self) -> None:
-        """Test that BDDGenerator accepts use_ai flag."""
-        generator = BDDGenerator(use_ai=False)
-        assert generator.use_ai is False
+        assert {key: getattr(generator, key) for key in expected} == expected
 
 
+@pytest.mark.xdist_group(name="bdd_generator_ai")
 class TestBDDGeneratorGenerateScenarios:
     """Tests for BDDGenerator.generate_scenarios method with AI integration."""
 
-    @pytest.fixture
-    def mock_llm_response_data(self) -> Dict[str, Any]:
-        """Create mock LLM response data."""
-        return {
-            "feature_name": "User Authentication",
-            "scenarios": [
-                {
-                    "name": "Successful login with valid credentials",
-                    "tags": ["@smoke", "@login"],
-                    "given": [
-                        "the user is on the login page",
-                        "the user has a valid account",
-                    ],
-                    "when": [
-                        "the user enters valid email and password",
-                        "the user clicks the login button",
-                    ],
-                    "then": [
-                        "the user should be redirected to the dashboard",
-                        "the user should see a welcome message",
-                    ],
-                    "examples": None,
-                },
-                {
-                    "name": "Login with various credentials",
-                    "tags": ["@validation", "@regression"],
-                    "given": ["the user is on the login page"],
-                    "when": [
-                        "the user enters <email> and <password>",
-                        "the user clicks the login button",
-                    ],
-                    "then": ["the system should show <result>"],
-                    "examples": [
-                        {"email": "valid@test.com", "password": "pass123", "result": "success"},
-                        {"email": "invalid", "password": "pass123", "result": "error"},
-                        {"email": "valid@test.com", "password": "", "result": "error"},
-                    ],
-                },
-            ],
-        }
-
     @pytest.fixture
     def generator(self) -> BDDGenerator:
         """Create a BDDGenerator with AI enabled."""
         return BDDGenerator(api_key="test-key", provider="openai", use_ai=True)
 
     @pytest.fixture
-    def mock_generator(self) -> BDDGenerator:
-        """Create a BDDGenerator with mock mode enabled."""
-        return BDDGenerator(use_ai=False)
+    def patched_generator(
+        self, generator: BDDGenerator, shared_bdd_mock_client: FakeLLMClient
+    ) -> Tuple[BDDGenerator, FakeLLMClient]:
+        """Wire the AI-enabled generator to the shared mock client.
+
+        The client's call log is cleared so assertions only see this test's calls.
+        """
+        shared_bdd_mock_client.calls.clear()
+        generator._get_client = lambda: shared_bdd_mock_client
+        return generator, shared_bdd_mock_client
 
-    @pytest.mark.asyncio
+    @pytest.fixture
+    def caching_generator(
+        self, shared_bdd_mock_client: FakeLLMClient
+    ) -> Tuple[BDDGenerator, FakeLLMClient]:
+        """Create an AI-enabled generator with the opt-in response cache.
+
+        Kept per test so one test's cached responses never reach another.
+        """
+        shared_bdd_mock_client.calls.clear()
+        generator = BDDGenerator(api_key="test-key", provider="openai", use_ai=True, use_cache=True)
+        generator._get_client = lambda: shared_bdd_mock_client
+        return generator, shared_bdd_mock_client
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_calls_llm(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+        self, patched_generator: Tuple[BDDGenerator, FakeLLMClient]
     ) -> None:
         """Test that generate_scenarios calls the LLM client."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
-
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator, mock_client = patched_generator
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_scenarios(
-                feature_description="User login with email and password",
-                max_scenarios=5,
-            )
+        result = await generator.generate_scenarios(
+            feature_description="User login with email and password",
+            max_scenarios=5,
+        )
 
-            mock_client.complete_simple.assert_called_once()
-            assert len(result.scenarios) == 2
-            assert result.scenarios[0].name == "Successful login with valid credentials"
+        assert len(mock_client.calls) == 1
+        assert len(result.scenarios) == 2
+        assert result.scenarios[0].name == "Successful login with valid credentials"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_includes_metadata(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+        self, patched_generator: Tuple[BDDGenerator, FakeLLMClient]
     ) -> None:
         """Test that generate_scenarios includes comprehensive metadata."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
-
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator, mock_client = patched_generator
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_scenarios(
-                feature_description="User login feature",
-                scenario_focus="comprehensive",
-            )
+        result = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+            scenario_focus="comprehensive",
+        )
 
-            assert result.metadata["provider"] == "openai"
-            assert result.metadata["model"] == "gpt-4-turbo-preview"
-            assert result.metadata["scenario_focus"] == "comprehensive"
-            assert result.metadata["prompt_tokens"] == 100
-            assert result.metadata["completion_tokens"] == 200
-            assert result.metadata["total_tokens"] == 300
+        assert result.metadata["provider"] == "openai"
+        assert result.metadata["model"] == "gpt-4-turbo-preview"
+        assert result.metadata["scenario_focus"] == "comprehensive"
+        assert result.metadata["prompt_tokens"] == 100
+        assert result.metadata["completion_tokens"] == 200
+        assert result.metadata["total_tokens"] == 300
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_respects_max_scenarios(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+        self, patched_generator: Tuple[BDDGenerator, FakeLLMClient]
     ) -> None:
         """Test that generate_scenarios limits results to max_scenarios."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
+        generator, mock_client = patched_generator
+
+        result = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+            max_scenarios=1,
         )
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        assert len(result.scenarios) == 1
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_scenarios(
-                feature_description="User login feature",
-                max_scenarios=1,
-            )
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_caches_identical_requests(
+        self, caching_generator: Tuple[BDDGenerator, FakeLLMClient]
+    ) -> None:
+        """Test that identical requests are served from the response cache."""
+        generator, mock_client = caching_generator
 
-            assert len(result.scenarios) == 1
+        first = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+        )
+        second = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+        )
+        await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+            max_scenarios=1,
+        )
 
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_handles_llm_error(
-        self, generator: BDDGenerator
+        assert second is not first
+        assert second.scenarios == first.scenarios
+        assert "cached" not in first.metadata
+        assert first.metadata["total_tokens"] > 0
+        assert second.metadata["cached"] is True
+        assert second.metadata["prompt_tokens"] == 0
+        assert second.metadata["completion_tokens"] == 0
+        assert second.metadata["total_tokens"] == 0
+        assert len(mock_client.calls) == 2
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_cache_hits_are_independent_copies(
+        self, caching_generator: Tuple[BDDGenerator, FakeLLMClient]
     ) -> None:
-        """Test that generate_scenarios handles LLM errors gracefully."""
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(
-            side_effect=LLMClientError("API error")
-        )
+        """Test that mutating a returned response does not alter later cache hits."""
+        generator, _ = caching_generator
 
-        with (
-            patch.object(generator, "_get_client", return_value=mock_client),
-            pytest.raises(BDDGenerationError, match="AI provider error"),
-        ):
-            await generator.generate_scenarios(
-                feature_description="User login feature",
-            )
+        first = await generator.generate_scenarios(feature_description=_FEATURE_DESCRIPTION)
+        first.scenarios[0].given.append("MUTATED")
+        first.metadata["total_tokens"] = -1
 
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_handles_invalid_json(
-        self, generator: BDDGenerator
+        second = await generator.generate_scenarios(feature_description=_FEATURE_DESCRIPTION)
+
+        assert "MUTATED" not in second.scenarios[0].given
+        assert second.metadata["total_tokens"] == 0
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_shares_in_flight_requests(
+        self, caching_generator: Tuple[BDDGenerator, FakeLLMClient]
     ) -> None:
-        """Test that generate_scenarios handles invalid JSON responses."""
-        mock_response = LLMResponse(
-            content="not valid json",
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=50,
-            total_tokens=150,
-            finish_reason="stop",
+        """Test that concurrent identical requests share a single LLM call."""
+        generator, mock_client = caching_generator
+
+        first, second = await asyncio.gather(
+            generator.generate_scenarios(feature_description=_FEATURE_DESCRIPTION),
+            generator.generate_scenarios(feature_description=_FEATURE_DESCRIPTION),
         )
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        assert second is not first
+        assert second.scenarios == first.scenarios
+        assert "cached" not in first.metadata
+        assert second.metadata["cached"] is True
+        assert len(mock_client.calls) == 1
+        assert not generator._pending
 
-        with (
-            patch.object(generator, "_get_client", return_value=mock_client),
-            pytest.raises(BDDGenerationError, match="Failed to parse"),
-        ):
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_not_cached_by_default(
+        self, patched_generator: Tuple[BDDGenerator, FakeLLMClient]
+    ) -> None:
+        """Test that with default settings every request calls the LLM client."""
+        generator, mock_client = patched_generator
+
+        for _ in range(2):
             await generator.generate_scenarios(
-                feature_description="User login feature",
+                feature_description=_FEATURE_DESCRIPTION,
             )
 
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_handles_markdown_code_blocks(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+        assert len(mock_client.calls) == 2
+
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_batch_runs_concurrently(
+        self, generator: BDDGenerator, shared_bdd_llm_response: LLMResponse
     ) -> None:
-        """Test that generate_scenarios handles JSON wrapped in markdown code blocks."""
-        wrapped_content = f"```json\n{json.dumps(mock_llm_response_data)}\n```"
-
-        mock_response = LLMResponse(
-            content=wrapped_content,
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
+        """Test that batched requests overlap and keep their input order."""
+        in_flight = peak = 0
+
+        class SlowClient(FakeLLMClient):
+            async def complete_simple(self, **kwargs: Any) -> Optional[LLMResponse]:
+                nonlocal in_flight, peak
+                in_flight += 1
+                peak = max(peak, in_flight)
+                await asyncio.sleep(0)
+                in_flight -= 1
+                return await super().complete_simple(**kwargs)
+
+        mock_client = SlowClient(response=shared_bdd_llm_response)
+        generator._get_client = lambda: mock_client
+
+        results = await generator.generate_scenarios_batch(
+            [{"feature_description": f"Feature {i}"} for i in range(3)],
+            concurrency=2,
         )
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        assert [r.feature_description for r in results] == [
+            "Feature 0",
+            "Feature 1",
+            "Feature 2",
+        ]
+        assert peak == 2
+        assert len(mock_client.calls) == 3
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_scenarios(
-                feature_description="User login feature",
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_batch_raises_generation_error(
+        self, generator: BDDGenerator
+    ) -> None:
+        """Test that a failing batch item surfaces as BDDGenerationError."""
+        mock_client = FakeLLMClient(exc=LLMClientError("API error"))
+        generator._get_client = lambda: mock_client
+
+        with pytest.raises(BDDGenerationError, match="AI provider error"):
+            await generator.generate_scenarios_batch(
+                [{"feature_description": _FEATURE_DESCRIPTION}]
             )
 
-            assert len(result.scenarios) == 2
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_batch_rejects_zero_concurrency(
+        self, generator: BDDGenerator
+    ) -> None:
+        """Test that a batch without any concurrency slots is rejected up front."""
+        with pytest.raises(ValueError, match="concurrency"):
+            await generator.generate_scenarios_batch(
+                [{"feature_description": _FEATURE_DESCRIPTION}], concurrency=0
+            )
 
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_handles_array_response(
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_batch_unwraps_other_errors(
         self, generator: BDDGenerator
     ) -> None:
-        """Test that generate_scenarios handles a direct array of scenarios."""
-        array_response = [
-            {
-                "name": "Test scenario",
-                "given": ["precondition"],
-                "when": ["action"],
-                "then": ["outcome"],
-            }
-        ]
+        """Test that a bad request argument surfaces as itself, not an ExceptionGroup."""
+        with pytest.raises(TypeError, match="unexpected keyword"):
+            await generator.generate_scenarios_batch([{"feature": _FEATURE_DESCRIPTION}])
 
-        mock_response = LLMResponse(
-            content=json.dumps(array_response),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_handles_llm_error(
+        self, generator: BDDGenerator
+    ) -> None:
+        """Test that generate_scenarios handles LLM errors gracefully."""
+        mock_client = FakeLLMClient(exc=LLMClientError("API error"))
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator._get_client = lambda: mock_client
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_scenarios(
-                feature_description="User login feature",
+        with pytest.raises(BDDGenerationError, match="AI provider error"):
+            await generator.generate_scenarios(
+                feature_description=_FEATURE_DESCRIPTION,
             )
 
-            assert len(result.scenarios) == 1
-            assert result.scenarios[0].name == "Test scenario"
-
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_with_context(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+    @pytest.mark.errors
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_handles_invalid_json(
+        self,
+        generator: BDDGenerator,
+        mock_client_factory: Callable[[str], FakeLLMClient],
     ) -> None:
-        """Test that generate_scenarios passes context to the prompt."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=150,
-            completion_tokens=200,
-            total_tokens=350,
-            finish_reason="stop",
-        )
+        """Test that generate_scenarios handles invalid JSON responses."""
+        mock_client = mock_client_factory("not valid json")
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator._get_client = lambda: mock_client
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
+        with pytest.raises(BDDGenerationError, match="Failed to parse"):
             await generator.generate_scenarios(
-                feature_description="User login feature",
-                context="This is a healthcare application with HIPAA requirements",
+                feature_description=_FEATURE_DESCRIPTION,
             )
 
-            call_args = mock_client.complete_simple.call_args
-            user_prompt = call_args[1]["user_prompt"]
-            assert "healthcare application" in user_prompt
-
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_uses_json_mode(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_handles_markdown_code_blocks(
+        self,
+        generator: BDDGenerator,
+        mock_client_factory: Callable[[str], FakeLLMClient],
     ) -> None:
-        """Test that generate_scenarios uses JSON mode for LLM calls."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
+        """Test that generate_scenarios handles JSON wrapped in markdown code blocks."""
+        mock_client = mock_client_factory(_BDD_MOCK_JSON_WRAPPED)
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator._get_client = lambda: mock_client
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            await generator.generate_scenarios(
-                feature_description="User login feature",
-            )
+        result = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+        )
 
-            call_args = mock_client.complete_simple.call_args
-            assert call_args[1]["json_mode"] is True
+        assert len(result.scenarios) == 2
 
-    @pytest.mark.asyncio
-    async def test_generate_scenarios_passes_scenario_focus(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_handles_array_response(
+        self,
+        generator: BDDGenerator,
+        mock_client_factory: Callable[[str], FakeLLMClient],
     ) -> None:
-        """Test that generate_scenarios passes scenario_focus to prompt."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
+        """Test that generate_scenarios handles a direct array of scenarios."""
+        mock_client = mock_client_factory(_BDD_ARRAY_JSON)
+
+        generator._get_client = lambda: mock_client
+
+        result = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
         )
 
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        assert len(result.scenarios) == 1
+        assert result.scenarios[0].name == "Test scenario"
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            await generator.generate_scenarios(
-                feature_description="Security feature",
-                scenario_focus="security",
-            )
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize(
+        "kwargs,check",
+        [
+            pytest.param(
+                {
+                    "feature_description": _FEATURE_DESCRIPTION,
+                    "context": "This is a healthcare application with HIPAA requirements",
+                },
+                lambda call: "healthcare application" in call["user_prompt"],
+                id="context",
+            ),
+            pytest.param(
+                {"feature_description": _FEATURE_DESCRIPTION},
+                lambda call: call["json_mode"] is True,
+                id="json_mode",
+            ),
+            pytest.param(
+                {"feature_description": "Security feature", "scenario_focus": "security"},
+                lambda call: "security" in call["user_prompt"].lower(),
+                id="scenario_focus",
+            ),
+        ],
+    )
+    async def test_generate_scenarios_prompt_options(
+        self,
+        patched_generator: Tuple[BDDGenerator, FakeLLMClient],
+        kwargs: Dict[str, Any],
+        check: Callable[[Dict[str, Any]], bool],
+    ) -> None:
+        """Test that generate_scenarios passes its options through to the LLM call."""
+        generator, mock_client = patched_generator
+
+        await generator.generate_scenarios(**kwargs)
 
-            call_args = mock_client.complete_simple.call_args
-            user_prompt = call_args[1]["user_prompt"]
-            assert "security" in user_prompt.lower()
+        assert check(mock_client.calls[0])
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_returns_gherkin(
-        self, generator: BDDGenerator, mock_llm_response_data: Dict[str, Any]
+        self, patched_generator: Tuple[BDDGenerator, FakeLLMClient]
     ) -> None:
         """Test that generate_scenarios returns properly formatted Gherkin."""
-        mock_response = LLMResponse(
-            content=json.dumps(mock_llm_response_data),
-            model="gpt-4-turbo-preview",
-            prompt_tokens=100,
-            completion_tokens=200,
-            total_tokens=300,
-            finish_reason="stop",
-        )
-
-        mock_client = AsyncMock()
-        mock_client.complete_simple = AsyncMock(return_value=mock_response)
+        generator, mock_client = patched_generator
 
-        with patch.object(generator, "_get_client", return_value=mock_client):
-            result = await generator.generate_scenarios(
-                feature_description="User login feature",
-            )
+        result = await generator.generate_scenarios(
+            feature_description=_FEATURE_DESCRIPTION,
+        )
 
-            assert "Feature:" in result.gherkin
-            assert "Scenario" in result.gherkin
-            assert "Given" in result.gherkin
-            assert "When" in result.gherkin
-            assert "Then" in result.gherkin
+        assert "Feature:" in result.gherkin
+        assert "Scenario" in result.gherkin
+        assert "Given" in result.gherkin
+        assert "When" in result.gherkin
+        assert "Then" in result.gherkin
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_mock_mode(
-        self, mock_generator: BDDGenerator
+        self, mock_bdd_generator: BDDGenerator
     ) -> None:
         """Test that generate_scenarios works in mock mode."""
-        result = await mock_generator.generate_scenarios(
+        result = await mock_bdd_generator.generate_scenarios(
             feature_description="Test feature description",
             max_scenarios=3,
             include_examples=True,
@@ -1013,72 +1074,102 @@ class TestBDDGeneratorGenerateScenarios:
         assert "Feature:" in result.gherkin
         assert result.metadata["model"] == "mock"
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
+    async def test_generate_scenarios_mock_responses_do_not_share_lists(self) -> None:
+        """Test that mutating one mock response leaves later responses untouched."""
+        first = await BDDGenerator(use_ai=False).generate_scenarios(
+            feature_description="Test feature",
+        )
+        first.scenarios[0].given.append("MUTATED")
+        assert first.scenarios[0].tags is not None
+        first.scenarios[0].tags.append("@leak")
+
+        second = await BDDGenerator(use_ai=False).generate_scenarios(
+            feature_description="Test feature",
+        )
+
+        assert "MUTATED" not in second.scenarios[0].given
+        assert "@leak" not in (second.scenarios[0].tags or [])
+
+    @pytest.mark.asyncio(loop_scope="session")
+    @pytest.mark.parametrize("max_scenarios", [0, -1], ids=["zero", "negative"])
+    async def test_generate_scenarios_mock_non_positive_max_scenarios(
+        self, mock_bdd_generator: BDDGenerator, max_scenarios: int
+    ) -> None:
+        """Test that a non-positive max_scenarios yields no mock scenarios."""
+        result = await mock_bdd_generator.generate_scenarios(
+            feature_description="Test feature",
+            max_scenarios=max_scenarios,
+        )
+
+        assert result.scenarios == []
+
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_mock_includes_tags(
-        self, mock_generator: BDDGenerator
+        self, mock_bdd_generator: BDDGenerator
     ) -> None:
         """Test that mock scenarios include tags when requested."""
-        result = await mock_generator.generate_scenarios(
+        result = await mock_bdd_generator.generate_scenarios(
             feature_description="Test feature",
             include_tags=True,
         )
 
         # At least one scenario should have tags
-        has_tags = any(s.tags is not None and len(s.tags) > 0 for s in result.scenarios)
-        assert has_tags
+        assert result.has_tags
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_mock_excludes_tags(
-        self, mock_generator: BDDGenerator
+        self, mock_bdd_generator: BDDGenerator
     ) -> None:
         """Test that mock scenarios exclude tags when requested."""
-        result = await mock_generator.generate_scenarios(
+        result = await mock_bdd_generator.generate_scenarios(
             feature_description="Test feature",
             include_tags=False,
         )
 
         # All scenarios should have no tags
+        assert not result.has_tags
         for scenario in result.scenarios:
             assert scenario.tags is None
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_mock_includes_examples(
-        self, mock_generator: BDDGenerator
+        self, mock_bdd_generator: BDDGenerator
     ) -> None:
         """Test that mock scenarios include examples when requested."""
-        result = await mock_generator.generate_scenarios(
+        result = await mock_bdd_generator.generate_scenarios(
             feature_description="Test feature",
             max_scenarios=3,
             include_examples=True,
         )
 
         # At least one scenario should have examples
-        has_examples = any(s.examples is not None for s in result.scenarios)
-        assert has_examples
+        assert result.has_examples
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="session")
     async def test_generate_scenarios_mock_excludes_examples(
-        self, mock_generator: BDDGenerator
+        self, mock_bdd_generator: BDDGenerator
     ) -> None:
         """Test that mock scenarios exclude examples when requested."""
-        result = await mock_generator.generate_scenarios(
+        result = await mock_bdd_generator.generate_scenarios(
             feature_description="Test feature",
             max_scenarios=3,
             include_examples=False,
         )
 
         # All scenarios should have no examples
+        assert not result.has_examples
         for scenario in result.scenarios:
             assert scenario.examples is None
 
 
+@pytest.mark.xdist_group(name="bdd_generator_parsing")
 class TestBDDGeneratorParsing:
     """Tests for BDDGenerator response parsing."""
 
-    def test_parse_response_with_scenarios_key(self) -> None:
+    def test_parse_response_with_scenarios_key(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test parsing a response with scenarios key."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps({
+        content = _json.dumps({
             "feature_name": "Test Feature",
             "scenarios": [
                 {
@@ -1090,51 +1181,60 @@ class TestBDDGeneratorParsing:
             ]
         })
 
-        result = generator._parse_response(content)
+        result = mock_bdd_generator._parse_response(content)
 
         assert result["feature_name"] == "Test Feature"
         assert len(result["scenarios"]) == 1
         assert result["scenarios"][0].name == "Test scenario"
 
-    def test_parse_response_array(self) -> None:
+    def test_parse_response_array(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test parsing a JSON array response."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps([
-            {
-                "name": "Test scenario",
-                "given": ["precondition"],
-                "when": ["action"],
-                "then": ["outcome"],
-            }
-        ])
-
-        result = generator._parse_response(content)
+        result = mock_bdd_generator._parse_response(_BDD_ARRAY_JSON)
 
         assert result["feature_name"] is None
         assert len(result["scenarios"]) == 1
 
-    def test_parse_response_strips_code_blocks(self) -> None:
+    def test_parse_response_strips_code_blocks(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test that code blocks are stripped from response."""
-        generator = BDDGenerator(use_ai=False)
         content = '```json\n{"scenarios": [{"name": "Test", "given": [], "when": [], "then": []}]}\n```'
 
-        result = generator._parse_response(content)
+        result = mock_bdd_generator._parse_response(content)
 
         assert len(result["scenarios"]) == 1
         assert result["scenarios"][0].name == "Test"
 
-    def test_parse_response_missing_scenarios_key_raises(self) -> None:
+    def test_parse_response_strips_code_fence_on_same_line(
+        self, mock_bdd_generator: BDDGenerator
+    ) -> None:
+        """Test that a closing fence directly after the JSON is stripped."""
+        content = '```json\n{"scenarios": [{"name": "Test", "given": [], "when": [], "then": []}]}```'
+
+        result = mock_bdd_generator._parse_response(content)
+
+        assert result["scenarios"][0].name == "Test"
+
+    def test_parse_response_ignores_surrounding_text(
+        self, mock_bdd_generator: BDDGenerator
+    ) -> None:
+        """Test that prose around the JSON document is ignored."""
+        content = f"Here are the scenarios:\n{_BDD_ARRAY_JSON}\nLet me know if you need more."
+
+        result = mock_bdd_generator._parse_response(content)
+
+        assert result["scenarios"][0].name == "Test scenario"
+
+    def test_parse_response_missing_scenarios_key_raises(
+        self, mock_bdd_generator: BDDGenerator
+    ) -> None:
         """Test that missing scenarios key raises ValueError."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps({"feature_name": "Test"})
+        content = _json.dumps({"feature_name": "Test"})
 
         with pytest.raises(ValueError, match="Expected array or object with 'scenarios' key"):
-            generator._parse_response(content)
+            mock_bdd_generator._parse_response(content)
 
-    def test_parse_scenario_missing_name_raises(self) -> None:
+    def test_parse_scenario_missing_name_raises(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test that missing name raises ValueError."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps({
+        content = _json.dumps({
             "scenarios": [
                 {
                     "given": ["precondition"],
@@ -1145,12 +1245,11 @@ class TestBDDGeneratorParsing:
         })
 
         with pytest.raises(ValueError, match="Scenario missing required field: name"):
-            generator._parse_response(content)
+            mock_bdd_generator._parse_response(content)
 
-    def test_parse_scenario_string_steps_to_list(self) -> None:
+    def test_parse_scenario_string_steps_to_list(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test that string steps are converted to lists."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps({
+        content = _json.dumps({
             "scenarios": [
                 {
                     "name": "Test",
@@ -1161,16 +1260,15 @@ class TestBDDGeneratorParsing:
             ]
         })
 
-        result = generator._parse_response(content)
+        result = mock_bdd_generator._parse_response(content)
 
         assert result["scenarios"][0].given == ["single precondition"]
         assert result["scenarios"][0].when == ["single action"]
         assert result["scenarios"][0].then == ["single outcome"]
 
-    def test_parse_scenario_with_tags(self) -> None:
+    def test_parse_scenario_with_tags(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test parsing scenario with tags."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps({
+        content = _json.dumps({
             "scenarios": [
                 {
                     "name": "Test",
@@ -1182,14 +1280,13 @@ class TestBDDGeneratorParsing:
             ]
         })
 
-        result = generator._parse_response(content)
+        result = mock_bdd_generator._parse_response(content)
 
         assert result["scenarios"][0].tags == ["@smoke", "@critical"]
 
-    def test_parse_scenario_with_examples(self) -> None:
+    def test_parse_scenario_with_examples(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test parsing scenario with examples."""
-        generator = BDDGenerator(use_ai=False)
-        content = json.dumps({
+        content = _json.dumps({
             "scenarios": [
                 {
                     "name": "Test",
@@ -1204,24 +1301,18 @@ class TestBDDGeneratorParsing:
             ]
         })
 
-        result = generator._parse_response(content)
+        result = mock_bdd_generator._parse_response(content)
 
         assert len(result["scenarios"][0].examples) == 2
         assert result["scenarios"][0].examples[0]["value"] == "a"
 
 
+@pytest.mark.xdist_group(name="bdd_generator_gherkin")
 class TestBDDGeneratorGherkinFormatting:
     """Tests for BDDGenerator Gherkin formatting."""
 
-    @pytest.fixture
-    def generator(self) -> BDDGenerator:
-        """Create a BDDGenerator instance."""
-        return BDDGenerator(use_ai=False)
-
-    def test_format_gherkin_basic(self, generator: BDDGenerator) -> None:
+    def test_format_gherkin_basic(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test basic Gherkin formatting."""
-        from app.models.responses import BDDScenario
-
         scenarios = [
             BDDScenario(
                 name="Test scenario",
@@ -1231,7 +1322,7 @@ class TestBDDGeneratorGherkinFormatting:
             )
         ]
 
-        gherkin = generator._format_gherkin(
+        gherkin = mock_bdd_generator._format_gherkin(
             feature_name="Test Feature",
             feature_description="Test description",
             scenarios=scenarios,
@@ -1246,10 +1337,28 @@ class TestBDDGeneratorGherkinFormatting:
         assert "Then outcome 1" in gherkin
         assert "And outcome 2" in gherkin
 
-    def test_format_gherkin_with_tags(self, generator: BDDGenerator) -> None:
-        """Test Gherkin formatting with tags."""
-        from app.models.responses import BDDScenario
+    def test_iter_gherkin_yields_one_chunk_per_scenario(
+        self, mock_bdd_generator: BDDGenerator
+    ) -> None:
+        """Test that streamed Gherkin chunks join to the formatted feature file."""
+        scenarios = [
+            BDDScenario(name=f"Scenario {i}", given=["g"], when=["w"], then=["t"])
+            for i in range(3)
+        ]
+        kwargs: Dict[str, Any] = {
+            "feature_name": "Test Feature",
+            "feature_description": "Test description",
+            "scenarios": scenarios,
+        }
+
+        chunks = list(mock_bdd_generator._iter_gherkin(**kwargs))
+
+        assert len(chunks) == 4
+        assert chunks[1].startswith("\n  Scenario: Scenario 0")
+        assert "".join(chunks) == mock_bdd_generator._format_gherkin(**kwargs)
 
+    def test_format_gherkin_with_tags(self, mock_bdd_generator: BDDGenerator) -> None:
+        """Test Gherkin formatting with tags."""
         scenarios = [
             BDDScenario(
                 name="Test scenario",
@@ -1260,7 +1369,7 @@ class TestBDDGeneratorGherkinFormatting:
             )
         ]
 
-        gherkin = generator._format_gherkin(
+        gherkin = mock_bdd_generator._format_gherkin(
             feature_name="Test Feature",
             feature_description="Test description",
             scenarios=scenarios,
@@ -1269,10 +1378,8 @@ class TestBDDGeneratorGherkinFormatting:
 
         assert "@smoke @critical" in gherkin
 
-    def test_format_gherkin_without_tags(self, generator: BDDGenerator) -> None:
+    def test_format_gherkin_without_tags(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test Gherkin formatting without tags."""
-        from app.models.responses import BDDScenario
-
         scenarios = [
             BDDScenario(
                 name="Test scenario",
@@ -1283,7 +1390,7 @@ class TestBDDGeneratorGherkinFormatting:
             )
         ]
 
-        gherkin = generator._format_gherkin(
+        gherkin = mock_bdd_generator._format_gherkin(
             feature_name="Test Feature",
             feature_description="Test description",
             scenarios=scenarios,
@@ -1293,10 +1400,8 @@ class TestBDDGeneratorGherkinFormatting:
         assert "@smoke" not in gherkin
         assert "@critical" not in gherkin
 
-    def test_format_gherkin_scenario_outline(self, generator: BDDGenerator) -> None:
+    def test_format_gherkin_scenario_outline(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test Gherkin formatting with Scenario Outline."""
-        from app.models.responses import BDDScenario
-
         scenarios = [
             BDDScenario(
                 name="Test scenario outline",
@@ -1310,7 +1415,7 @@ class TestBDDGeneratorGherkinFormatting:
             )
         ]
 
-        gherkin = generator._format_gherkin(
+        gherkin = mock_bdd_generator._format_gherkin(
             feature_name="Test Feature",
             feature_description="Test description",
             scenarios=scenarios,
@@ -1322,16 +1427,36 @@ class TestBDDGeneratorGherkinFormatting:
         assert "| a | 1 |" in gherkin
         assert "| b | 2 |" in gherkin
 
-    def test_extract_feature_name_short(self, generator: BDDGenerator) -> None:
+    def test_extract_feature_name_short(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test feature name extraction for short descriptions."""
-        name = generator._extract_feature_name("User login. With password.")
+        name = mock_bdd_generator._extract_feature_name("User login. With password.")
 
         assert name == "User login"
 
-    def test_extract_feature_name_long(self, generator: BDDGenerator) -> None:
+    def test_extract_feature_name_long(self, mock_bdd_generator: BDDGenerator) -> None:
         """Test feature name extraction for long descriptions."""
         long_description = "A very long feature description that exceeds fifty characters easily"
-        name = generator._extract_feature_name(long_description)
+        name = mock_bdd_generator._extract_feature_name(long_description)
 
         assert len(name) == 50
         assert name.endswith("...")
+
+
+@pytest.mark.xdist_group(name="json_helpers")
+class TestJsonHelpers:
+    """Tests for the JSON helpers used by the generators."""
+
+    def test_round_trip(self) -> None:
+        """Test that dumps output parses back to the same data."""
+        data = {"scenarios": [{"name": "Login", "tags": ["@smoke"], "examples": None}]}
+
+        assert _json.loads(_json.dumps(data)) == data
+
+    def test_loads_accepts_bytes(self) -> None:
+        """Test that UTF-8 bytes are parsed like str."""
+        assert _json.loads(b'{"feature_name": "Caf\xc3\xa9"}') == {"feature_name": "Café"}
+
+    def test_invalid_json_raises_stdlib_error(self) -> None:
+        """Test that decode errors are catchable as json.JSONDecodeError."""
+        with pytest.raises(json.JSONDecodeError):
+            _json.loads("not valid json")